@@ -1,6 +1,10 @@
 """Main entry point for the folder encryptor application."""
 
+import multiprocessing
+
 from app.cli.main import main
 
 if __name__ == "__main__":
+    # Worker processes re-run the entry point in frozen executables
+    multiprocessing.freeze_support()
     main()
@@ -2,9 +2,11 @@
 
 import argparse
 import logging
+import os
 import sys
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 try:
     from tqdm import tqdm
@@ -12,8 +14,6 @@ try:
 except ImportError:
     TQDM_AVAILABLE = False
 
-from app.services.encrypt_service import EncryptService
-from app.services.decrypt_service import DecryptService
 from app.core.exceptions import (
     FolderEncryptorError,
     InvalidPasswordError,
@@ -23,29 +23,40 @@ from app.utils.logger import setup_logging
 from app.utils.helpers import (
     validate_path,
     format_size,
-    get_folder_size,
     confirm_action,
 )
-from app.utils.config import ConfigManager
+from app.utils.config import ConfigManager, get_config_manager
 from app.utils.password_input import get_password_interactive
 
 
 logger = logging.getLogger(__name__)
 
+# Separator used in the relative paths passed to progress callbacks
+_PATH_SEP = os.sep
+
 
 class ProgressBar:
     """Progress bar wrapper (uses tqdm if available)."""
 
-    def __init__(self, total: int, desc: str = "Processing"):
+    # Minimum seconds between redraws of the tqdm bar
+    UPDATE_INTERVAL = 0.1
+
+    def __init__(
+        self, total: int, desc: str = "Processing", show_detail: bool = True
+    ):
         """Initialize progress bar.
 
         Args:
             total: Total number of items.
             desc: Description text.
+            show_detail: Whether to show the current file name.
         """
         self.total = total
         self.desc = desc
+        self.show_detail = show_detail
         self.current = 0
+        self._pending = 0
+        self._last = time.monotonic()
 
         if TQDM_AVAILABLE:
             self.pbar = tqdm(
@@ -53,30 +64,61 @@ class ProgressBar:
                 desc=desc,
                 unit="files",
                 bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+                mininterval=self.UPDATE_INTERVAL,
+                miniters=max(1, total // 1000),
             )
         else:
             self.pbar = None
-            print(f"{desc}: 0/{total}")
+            # Print roughly every 1% of items (at least every 8) using a
+            # power-of-two mask so the check is a single AND
+            self._text_mask = (1 << max(3, (total // 100).bit_length())) - 1
+            self._text_template = f"{desc}: %d/%d\n"
+            sys.stdout.write(self._text_template % (0, total))
 
     def update(self, filename: str) -> None:
         """Update progress bar.
 
+        Updates to the tqdm bar are batched and flushed at most every
+        ``UPDATE_INTERVAL`` seconds, and always on the last item.
+
         Args:
             filename: Current file being processed.
         """
         self.current += 1
 
         if self.pbar:
-            self.pbar.set_postfix_str(f"{Path(filename).name[:30]}")
-            self.pbar.update(1)
+            self._pending += 1
+            now = time.monotonic()
+            if now - self._last >= self.UPDATE_INTERVAL or self.current == self.total:
+                if self.show_detail:
+                    name = filename[filename.rfind(_PATH_SEP) + 1 :][:30]
+                    self.pbar.set_postfix_str(name, refresh=False)
+                self.pbar.update(self._pending)
+                self._pending = 0
+                self._last = now
         else:
             # Simple text progress
-            if self.current % 10 == 0 or self.current == self.total:
-                print(f"{self.desc}: {self.current}/{self.total}")
+            if not self.current & self._text_mask or self.current == self.total:
+                sys.stdout.write(self._text_template % (self.current, self.total))
+
+    def set_total(self, total: int) -> None:
+        """Change the total number of items, e.g. while they are still found.
+
+        Args:
+            total: New total number of items.
+        """
+        self.total = total
+        if self.pbar:
+            self.pbar.total = total
+        else:
+            self._text_mask = (1 << max(3, (total // 100).bit_length())) - 1
 
     def close(self) -> None:
         """Close progress bar."""
         if self.pbar:
+            if self._pending:
+                self.pbar.update(self._pending)
+                self._pending = 0
             self.pbar.close()
 
 
@@ -90,6 +132,9 @@ def encrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    # Imported here so each command only loads the service it uses
+    from app.services.encrypt_service import EncryptService
+
     try:
         # Validate paths
         input_path = validate_path(args.input, must_exist=True)
@@ -123,20 +168,26 @@ def encrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
                 return 0
 
         # Display info
-        folder_size = get_folder_size(input_path)
         logger.info(f"Input folder: {input_path}")
         logger.info(f"Output folder: {output_path}")
-        logger.info(f"Total size: {format_size(folder_size)}")
 
         # Initialize service (use config values if not specified in args)
         use_argon2 = args.use_argon2 or config.get_bool("Security", "use_argon2", False)
         verify_password = not args.skip_password_check and config.get_bool(
             "Security", "verify_password_strength", True
         )
+        bundle_small_files = args.bundle_small_files or config.get_bool(
+            "Performance", "bundle_small_files", False
+        )
+        workers = args.workers or config.get_int("Performance", "workers", 0)
+        chunk_size = config.get_int("Performance", "chunk_size", 0)
         
         encrypt_service = EncryptService(
             use_argon2=use_argon2,
             verify_password_strength=verify_password,
+            bundle_small_files=bundle_small_files,
+            max_workers=workers or None,
+            chunk_size=chunk_size or None,
         )
 
         # Progress callback
@@ -146,9 +197,18 @@ def encrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
         def progress_callback(filename: str, current: int, total: int) -> None:
             nonlocal progress_bar
             if progress_bar is None:
-                progress_bar = ProgressBar(total, "Encrypting")
+                progress_bar = ProgressBar(
+                    total, "Encrypting", show_detail=not args.no_progress_detail
+                )
+            elif total != progress_bar.total:
+                # The total grows while the folder is still being scanned
+                progress_bar.set_total(total)
             progress_bar.update(filename)
 
+        # Folder size is reported from the scan done by the encryption itself
+        def info_callback(total_files: int, total_bytes: int) -> None:
+            logger.info(f"Total size: {format_size(total_bytes)} ({total_files} files)")
+
         # Encrypt
         logger.info("Starting encryption...")
         encrypt_service.encrypt_folder(
@@ -156,6 +216,7 @@ def encrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
             str(output_path),
             password,
             progress_callback=progress_callback if show_progress else None,
+            info_callback=info_callback,
         )
 
         if progress_bar:
@@ -190,6 +251,9 @@ def decrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
     Returns:
         Exit code (0 for success, 1 for failure).
     """
+    # Imported here so each command only loads the service it uses
+    from app.services.decrypt_service import DecryptService
+
     try:
         # Validate paths
         input_path = validate_path(args.input, must_exist=True)
@@ -228,8 +292,14 @@ def decrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
 
         # Initialize service (use config values if not specified in args)
         use_argon2 = args.use_argon2 or config.get_bool("Security", "use_argon2", False)
+        workers = args.workers or config.get_int("Performance", "workers", 0)
+        chunk_size = config.get_int("Performance", "chunk_size", 0)
         
-        decrypt_service = DecryptService(use_argon2=use_argon2)
+        decrypt_service = DecryptService(
+            use_argon2=use_argon2,
+            max_workers=workers or None,
+            chunk_size=chunk_size or None,
+        )
 
         # Progress callback
         progress_bar: Optional[ProgressBar] = None
@@ -238,7 +308,9 @@ def decrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
         def progress_callback(filename: str, current: int, total: int) -> None:
             nonlocal progress_bar
             if progress_bar is None:
-                progress_bar = ProgressBar(total, "Decrypting")
+                progress_bar = ProgressBar(
+                    total, "Decrypting", show_detail=not args.no_progress_detail
+                )
             progress_bar.update(filename)
 
         # Decrypt
@@ -278,6 +350,13 @@ def decrypt_command(args: argparse.Namespace, config: ConfigManager) -> int:
         return 1
 
 
+# Command name -> handler(args, config) returning an exit code
+COMMANDS: Dict[str, Callable[[argparse.Namespace, ConfigManager], int]] = {
+    "encrypt": encrypt_command,
+    "decrypt": decrypt_command,
+}
+
+
 def main() -> int:
     """Main entry point for CLI.
 
@@ -358,11 +437,27 @@ Examples:
         action="store_true",
         help="Skip password strength validation",
     )
+    encrypt_parser.add_argument(
+        "--bundle-small-files",
+        action="store_true",
+        help="Pack files smaller than 1 MB into encrypted bundles (faster for many small files)",
+    )
+    encrypt_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=0,
+        help="Number of files to encrypt in parallel (default: number of CPUs)",
+    )
     encrypt_parser.add_argument(
         "--no-progress",
         action="store_true",
         help="Disable progress bar",
     )
+    encrypt_parser.add_argument(
+        "--no-progress-detail",
+        action="store_true",
+        help="Do not show the current file name in the progress bar",
+    )
     encrypt_parser.add_argument(
         "-f", "--force",
         action="store_true",
@@ -393,11 +488,22 @@ Examples:
         action="store_true",
         help="Use Argon2id for key derivation (must match encryption)",
     )
+    decrypt_parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        default=0,
+        help="Number of files to decrypt in parallel (default: number of CPUs)",
+    )
     decrypt_parser.add_argument(
         "--no-progress",
         action="store_true",
         help="Disable progress bar",
     )
+    decrypt_parser.add_argument(
+        "--no-progress-detail",
+        action="store_true",
+        help="Do not show the current file name in the progress bar",
+    )
     decrypt_parser.add_argument(
         "-f", "--force",
         action="store_true",
@@ -415,24 +521,18 @@ Examples:
 
     # Initialize configuration
     config_path = Path(args.config) if args.config else None
-    config = ConfigManager(config_path)
+    config = get_config_manager(config_path)
     
     if args.verbose:
         logger.debug(f"Configuration loaded from: {config.config_path}")
 
-    # Check command
-    if not args.command:
+    # Execute command
+    handler = COMMANDS.get(args.command)
+    if handler is None:
         parser.print_help()
         return 0
 
-    # Execute command
-    if args.command == "encrypt":
-        return encrypt_command(args, config)
-    elif args.command == "decrypt":
-        return decrypt_command(args, config)
-    else:
-        parser.print_help()
-        return 1
+    return handler(args, config)
 
 
 if __name__ == "__main__":
@@ -1,11 +1,14 @@
 """Custom exception classes for the folder encryptor."""
 
-from typing import Optional
+from typing import Optional, Tuple, Type
 
 
 class FolderEncryptorError(Exception):
     """Base exception for all folder encryptor errors."""
 
+    # Keep attributes out of the lazily created instance __dict__
+    __slots__ = ("message", "details")
+
     def __init__(self, message: str, details: Optional[str] = None) -> None:
         """Initialize the exception.
 
@@ -17,44 +20,54 @@ class FolderEncryptorError(Exception):
         self.details = details
         super().__init__(self.message)
 
+    def __reduce__(
+        self,
+    ) -> Tuple[Type["FolderEncryptorError"], Tuple[str, Optional[str]]]:
+        """Support pickling, which does not copy slot attributes by default.
+
+        Returns:
+            Class and constructor arguments.
+        """
+        return self.__class__, (self.message, self.details)
+
 
 class CryptoError(FolderEncryptorError):
     """Raised when cryptographic operation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class DecryptionError(CryptoError):
     """Raised when decryption fails (wrong password or corrupted data)."""
 
-    pass
+    __slots__ = ()
 
 
 class EncryptionError(CryptoError):
     """Raised when encryption fails."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidPasswordError(FolderEncryptorError):
     """Raised when password validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class FileProcessingError(FolderEncryptorError):
     """Raised when file processing fails."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidMetadataError(FolderEncryptorError):
     """Raised when metadata is invalid or corrupted."""
 
-    pass
+    __slots__ = ()
 
 
 class UnsupportedVersionError(FolderEncryptorError):
     """Raised when encrypted data version is not supported."""
 
-    pass
+    __slots__ = ()
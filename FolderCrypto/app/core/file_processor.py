@@ -1,17 +1,100 @@
 """File and folder processing for encryption and decryption."""
 
 import os
+import itertools
 import json
+import operator
+import queue
+import stat
 import shutil
+import tarfile
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from pathlib import Path
-from typing import List, Dict, Callable, Optional
-from dataclasses import dataclass, asdict
+from typing import (
+    IO,
+    Any,
+    List,
+    Dict,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    Set,
+    Tuple,
+)
+from dataclasses import dataclass, fields
 
 from .crypto_engine import CryptoEngine
 from .exceptions import FileProcessingError, InvalidMetadataError
 
+# Optional faster JSON encoder/decoder for the metadata file
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Bytes at the start of each input file to prefetch before reading it
+READAHEAD_SIZE = 8 * 1024 * 1024
+
+
+def _fadvise(file: IO[bytes], advice: str, length: int = 0) -> None:
+    """Give the kernel an access-pattern hint for an open file.
+
+    Args:
+        file: Open file object.
+        advice: Name of an ``os.POSIX_FADV_*`` constant.
+        length: Number of bytes from the start the hint covers (0 for all).
+    """
+    # posix_fadvise is unavailable on some platforms (e.g. Windows)
+    if not hasattr(os, "posix_fadvise") or not hasattr(os, advice):
+        return
+
+    try:
+        os.posix_fadvise(file.fileno(), 0, length, getattr(os, advice))
+    except OSError:
+        pass  # Hints are best-effort
+
+
+def _fadvise_input(file: IO[bytes]) -> None:
+    """Hint that an input file is about to be read once, front to back.
+
+    Besides widening read-ahead, the head of the file is requested up
+    front so the first chunks are already cached by the time the output
+    file is open and the crypto loop starts.
+
+    Args:
+        file: Open input file object.
+    """
+    _fadvise(file, "POSIX_FADV_SEQUENTIAL")
+    _fadvise(file, "POSIX_FADV_WILLNEED", READAHEAD_SIZE)
+
+
+# Per-file job: (item index, name, size in bytes, worker arguments)
+Job = Tuple[int, str, int, Tuple[Any, ...]]
+
+# Folder entry found by a scan: (path, stat result)
+ScanItem = Tuple[Path, os.stat_result]
+
+
+@dataclass(slots=True)
+class _ScanTotals:
+    """Running totals of a folder scan."""
+
+    items: int = 0
+    files: int = 0
+    size: int = 0
+
+
+@dataclass(slots=True, frozen=True)
 class FileMetadata:
     """Metadata for an encrypted file."""
 
@@ -20,27 +103,225 @@ class FileMetadata:
     encrypted_size: int
     is_directory: bool
     permissions: Optional[int] = None
+    bundle: Optional[int] = None  # Bundle index for bundled small files
+
+
+def _encrypt_one(
+    crypto_engine: CryptoEngine,
+    input_file_path: Path,
+    output_file_path: Path,
+    relative_path: str,
+    buffering: int = -1,
+) -> FileMetadata:
+    """Encrypt a single file.
+
+    Defined at module level so it can run in a worker process.
+
+    Args:
+        crypto_engine: Crypto engine for encryption.
+        input_file_path: File to encrypt.
+        output_file_path: Encrypted file to write.
+        relative_path: Path relative to the input folder.
+        buffering: Output buffer size in bytes, as for ``open``.
+
+    Returns:
+        Metadata for the encrypted file.
+
+    Raises:
+        FileProcessingError: If encryption fails.
+    """
+    try:
+        with open(input_file_path, "rb") as input_file:
+            input_stat = os.fstat(input_file.fileno())
+
+            # Input is read once, front to back
+            _fadvise_input(input_file)
+            with open(output_file_path, "wb", buffering) as output_file:
+                # Use relative path as associated data
+                ad = relative_path.encode("utf-8")
+                encrypted_size = crypto_engine.encrypt_file(
+                    input_file, output_file, ad
+                )
+
+                # Ciphertext is not read back; start writeback and let the
+                # kernel drop the pages instead of evicting hotter data
+                output_file.flush()
+                _fadvise(output_file, "POSIX_FADV_DONTNEED")
+            # Drop it from the page cache once consumed
+            _fadvise(input_file, "POSIX_FADV_DONTNEED")
+
+        return FileMetadata(
+            relative_path=relative_path,
+            original_size=input_stat.st_size,
+            encrypted_size=encrypted_size,
+            is_directory=False,
+            permissions=input_stat.st_mode,
+        )
+
+    except Exception as e:
+        raise FileProcessingError(
+            f"Failed to encrypt {relative_path}: {str(e)}"
+        ) from e
+
+
+def _decrypt_one(
+    crypto_engine: CryptoEngine,
+    input_file_path: Path,
+    output_file_path: Path,
+    metadata: FileMetadata,
+    buffering: int = -1,
+) -> None:
+    """Decrypt a single file and restore its permissions.
+
+    Defined at module level so it can run in a worker process.
+
+    Args:
+        crypto_engine: Crypto engine for decryption.
+        input_file_path: Encrypted file to read.
+        output_file_path: Decrypted file to write.
+        metadata: Metadata recorded for the file.
+        buffering: Output buffer size in bytes, as for ``open``.
+
+    Raises:
+        FileProcessingError: If the file is missing, decryption fails or the
+            decrypted size does not match the metadata.
+    """
+    relative_path = metadata.relative_path
+
+    try:
+        try:
+            input_file = open(input_file_path, "rb")
+        except FileNotFoundError as e:
+            raise FileProcessingError(
+                f"Encrypted file not found: {input_file_path}"
+            ) from e
+
+        with input_file:
+            _fadvise_input(input_file)
+            try:
+                with open(output_file_path, "wb", buffering) as output_file:
+                    # Use relative path as associated data
+                    ad = relative_path.encode("utf-8")
+                    decrypted_size = crypto_engine.decrypt_file(
+                        input_file, output_file, ad
+                    )
+                    FileProcessor._restore_file(
+                        output_file, metadata, decrypted_size
+                    )
+            except Exception:
+                # Do not leave unauthenticated plaintext behind
+                output_file_path.unlink(missing_ok=True)
+                raise
+            _fadvise(input_file, "POSIX_FADV_DONTNEED")
+
+    except FileProcessingError:
+        raise
+    except Exception as e:
+        raise FileProcessingError(
+            f"Failed to decrypt {relative_path}: {str(e)}"
+        ) from e
+
+
+# Crypto engine of the current worker process, set by _init_worker
+_worker_engine: Optional[CryptoEngine] = None
+
+
+def _init_worker(crypto_engine: CryptoEngine) -> None:
+    """Store the crypto engine in a worker process when it starts.
+
+    The engine (and its key) is sent to each worker once, instead of with
+    every batch.
+
+    Args:
+        crypto_engine: Crypto engine used by all jobs in this process.
+    """
+    global _worker_engine
+    _worker_engine = crypto_engine
+
+
+def _run_batch(
+    worker: Callable[..., Any],
+    batch: List[Tuple[Any, ...]],
+) -> List[Any]:
+    """Run a worker function over a batch of jobs in one worker process.
+
+    Args:
+        worker: Module-level function called as ``worker(crypto_engine, *args)``.
+        batch: Argument tuples, one per job.
+
+    Returns:
+        Worker results, in batch order.
+    """
+    return [worker(_worker_engine, *args) for args in batch]
 
 
 class FileProcessor:
     """Handles file and folder processing for encryption/decryption."""
 
     METADATA_FILENAME = ".folder_crypto_metadata.enc"
+
+    # Metadata format version
+    # v1: "files" is a list of objects keyed by field name
+    # v2: "schema" lists the field names once, "files" holds value arrays
+    METADATA_VERSION = 2
+    SUPPORTED_METADATA_VERSIONS = (1, 2)
+    METADATA_FIELDS = tuple(f.name for f in fields(FileMetadata))
     ENCRYPTED_EXTENSION = ".encrypted"
 
-    def __init__(self, crypto_engine: CryptoEngine) -> None:
+    # Small-file bundling
+    BUNDLE_PREFIX = "bundle_"
+    BUNDLE_EXTENSION = ".enc"
+    BUNDLE_FILE_THRESHOLD = 1024 * 1024  # Files below 1 MB are bundled
+    BUNDLE_MAX_SIZE = 64 * 1024 * 1024  # 64 MB per bundle
+
+    # Files are sent to worker processes in batches of about this many bytes,
+    # so small files share one crypto engine and one round trip
+    JOB_BATCH_SIZE = 1024 * 1024  # 1 MB
+
+    # Directory listing is I/O-latency bound, so several are run at once
+    SCAN_WORKERS = 8
+
+    def __init__(
+        self,
+        crypto_engine: CryptoEngine,
+        bundle_small_files: bool = False,
+        max_workers: Optional[int] = None,
+        write_buffer_size: Optional[int] = None,
+    ) -> None:
         """Initialize file processor.
 
         Args:
             crypto_engine: Crypto engine for encryption/decryption.
+            bundle_small_files: Whether to pack small files into encrypted
+                tar bundles instead of encrypting them one by one.
+            max_workers: Number of worker processes used to encrypt or
+                decrypt files in parallel. Defaults to the number of CPUs;
+                1 processes files in the calling process.
+            write_buffer_size: Buffer size in bytes for files written to the
+                output folder (defaults to Python's default buffering).
+
+        Raises:
+            FileProcessingError: If the write buffer size is not positive.
         """
+        if write_buffer_size is not None and write_buffer_size <= 0:
+            raise FileProcessingError(
+                f"Write buffer size must be positive, got {write_buffer_size}"
+            )
+
         self.crypto_engine = crypto_engine
+        self.bundle_small_files = bundle_small_files
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.write_buffer_size = write_buffer_size
+
+        # Value passed as ``buffering`` to open() for output files
+        self._buffering = write_buffer_size or -1
 
     def encrypt_folder(
         self,
         input_path: Path,
         output_path: Path,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        info_callback: Optional[Callable[[int, int], None]] = None,
     ) -> None:
         """Encrypt an entire folder recursively.
 
@@ -48,6 +329,8 @@ class FileProcessor:
             input_path: Input folder path.
             output_path: Output folder path.
             progress_callback: Optional callback(filename, current, total).
+            info_callback: Optional callback(total_files, total_bytes), called
+                once the folder has been scanned.
 
         Raises:
             FileProcessingError: If processing fails.
@@ -60,64 +343,112 @@ class FileProcessor:
 
         # Create output directory
         output_path.mkdir(parents=True, exist_ok=True)
+        created_dirs = {output_path}
 
-        # Collect all files and directories
-        all_items = self._collect_items(input_path)
-        total_items = len(all_items)
+        # Items are encrypted while the folder is still being scanned, so the
+        # progress total grows until the scan is complete
+        totals = _ScanTotals()
+        items = self._iter_items(input_path, totals)
 
-        metadata_list: List[FileMetadata] = []
+        # Metadata by item index, so the saved order does not depend on the
+        # order in which parallel jobs finish
+        metadata_by_index: Dict[int, FileMetadata] = {}
+        progress = self._progress_counter(lambda: totals.items, progress_callback)
 
-        for idx, item_path in enumerate(all_items, 1):
-            relative_path = item_path.relative_to(input_path)
+        def queue_items() -> Iterator[Job]:
+            """Record directories and bundle small files, yielding other files."""
+            # Currently open bundle: (tar archive, spooled buffer)
+            bundle_index = 0
+            bundle: Optional[Tuple[tarfile.TarFile, IO[bytes]]] = None
+            bundle_size = 0
 
-            if progress_callback:
-                progress_callback(str(relative_path), idx, total_items)
-
-            if item_path.is_dir():
-                # Record directory in metadata
-                metadata = FileMetadata(
-                    relative_path=str(relative_path),
-                    original_size=0,
-                    encrypted_size=0,
-                    is_directory=True,
-                    permissions=item_path.stat().st_mode,
-                )
-                metadata_list.append(metadata)
-            else:
-                # Encrypt file
-                output_file_path = output_path / (
-                    str(relative_path) + self.ENCRYPTED_EXTENSION
-                )
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
+            for idx, (item_path, item_stat) in enumerate(items):
+                relative_path = item_path.relative_to(input_path)
+                relative_name = str(relative_path)
 
-                original_size = item_path.stat().st_size
+                if stat.S_ISDIR(item_stat.st_mode):
+                    progress(relative_name)
 
-                try:
-                    with open(item_path, "rb") as input_file:
-                        with open(output_file_path, "wb") as output_file:
-                            # Use relative path as associated data
-                            ad = str(relative_path).encode("utf-8")
-                            self.crypto_engine.encrypt_file(
-                                input_file, output_file, ad
-                            )
+                    # Record directory in metadata
+                    metadata = FileMetadata(
+                        relative_path=relative_name,
+                        original_size=0,
+                        encrypted_size=0,
+                        is_directory=True,
+                        permissions=item_stat.st_mode,
+                    )
+                    metadata_by_index[idx] = metadata
+                elif (
+                    self.bundle_small_files
+                    and item_stat.st_size < self.BUNDLE_FILE_THRESHOLD
+                ):
+                    progress(relative_name)
+
+                    # Append small file to the current bundle
+                    original_size = item_stat.st_size
 
-                    encrypted_size = output_file_path.stat().st_size
+                    if bundle is not None and (
+                        bundle_size + original_size > self.BUNDLE_MAX_SIZE
+                    ):
+                        self._write_bundle(output_path, bundle_index, *bundle)
+                        bundle = None
+                        bundle_index += 1
+
+                    if bundle is None:
+                        bundle = self._open_bundle()
+                        bundle_size = 0
+
+                    try:
+                        tar_info = tarfile.TarInfo(relative_path.as_posix())
+                        tar_info.size = original_size
+                        with open(item_path, "rb") as input_file:
+                            bundle[0].addfile(tar_info, input_file)
+                        bundle_size += original_size
+                    except Exception as e:
+                        raise FileProcessingError(
+                            f"Failed to bundle {relative_path}: {str(e)}"
+                        ) from e
 
                     metadata = FileMetadata(
-                        relative_path=str(relative_path),
+                        relative_path=relative_name,
                         original_size=original_size,
-                        encrypted_size=encrypted_size,
+                        encrypted_size=0,
                         is_directory=False,
-                        permissions=item_path.stat().st_mode,
+                        permissions=item_stat.st_mode,
+                        bundle=bundle_index,
+                    )
+                    metadata_by_index[idx] = metadata
+                else:
+                    # Queue file for encryption
+                    output_file_path = output_path / (
+                        relative_name + self.ENCRYPTED_EXTENSION
                     )
-                    metadata_list.append(metadata)
+                    self._make_parent(output_file_path, created_dirs)
 
-                except Exception as e:
-                    raise FileProcessingError(
-                        f"Failed to encrypt {relative_path}: {str(e)}"
-                    ) from e
+                    yield (
+                        idx,
+                        relative_name,
+                        item_stat.st_size,
+                        (
+                            item_path,
+                            output_file_path,
+                            relative_name,
+                            self._buffering,
+                        ),
+                    )
+
+            if info_callback:
+                info_callback(totals.files, totals.size)
+
+            if bundle is not None:
+                self._write_bundle(output_path, bundle_index, *bundle)
+
+        # Encrypt queued files as they are found
+        for idx, metadata in self._run_jobs(_encrypt_one, queue_items(), progress):
+            metadata_by_index[idx] = metadata
 
         # Save encrypted metadata
+        metadata_list = [metadata_by_index[idx] for idx in sorted(metadata_by_index)]
         self._save_metadata(output_path, metadata_list)
 
     def decrypt_folder(
@@ -148,60 +479,86 @@ class FileProcessor:
 
         # Create output directory
         output_path.mkdir(parents=True, exist_ok=True)
+        created_dirs = {output_path}
 
-        for idx, metadata in enumerate(metadata_list, 1):
-            relative_path = Path(metadata.relative_path)
+        jobs: List[Job] = []
+        progress = self._progress_counter(lambda: total_items, progress_callback)
 
-            if progress_callback:
-                progress_callback(str(relative_path), idx, total_items)
-
-            if metadata.is_directory:
-                # Recreate directory
-                dir_path = output_path / relative_path
-                dir_path.mkdir(parents=True, exist_ok=True)
-                
-                # Restore permissions if available
-                if metadata.permissions:
-                    try:
-                        os.chmod(dir_path, metadata.permissions)
-                    except Exception:
-                        pass  # Ignore permission errors
-            else:
-                # Decrypt file
-                encrypted_file_path = input_path / (
-                    str(relative_path) + self.ENCRYPTED_EXTENSION
-                )
-                output_file_path = output_path / relative_path
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        # Currently open bundle: (index, tar archive, spooled buffer, members)
+        bundle: Optional[
+            Tuple[int, tarfile.TarFile, IO[bytes], Dict[str, tarfile.TarInfo]]
+        ] = None
 
-                if not encrypted_file_path.exists():
-                    raise FileProcessingError(
-                        f"Encrypted file not found: {encrypted_file_path}"
-                    )
+        try:
+            for idx, metadata in enumerate(metadata_list):
+                relative_path = Path(metadata.relative_path)
+                relative_name = str(relative_path)
 
-                try:
-                    with open(encrypted_file_path, "rb") as input_file:
-                        with open(output_file_path, "wb") as output_file:
-                            # Use relative path as associated data
-                            ad = str(relative_path).encode("utf-8")
-                            self.crypto_engine.decrypt_file(
-                                input_file, output_file, ad
-                            )
+                if metadata.is_directory:
+                    progress(relative_name)
 
-                    # Verify decrypted size
-                    decrypted_size = output_file_path.stat().st_size
-                    if decrypted_size != metadata.original_size:
-                        raise FileProcessingError(
-                            f"Size mismatch for {relative_path}: "
-                            f"expected {metadata.original_size}, got {decrypted_size}"
-                        )
+                    # Recreate directory
+                    dir_path = output_path / relative_path
+                    self._make_dir(dir_path, created_dirs)
 
                     # Restore permissions if available
                     if metadata.permissions:
                         try:
-                            os.chmod(output_file_path, metadata.permissions)
+                            os.chmod(dir_path, metadata.permissions)
                         except Exception:
                             pass  # Ignore permission errors
+                    continue
+
+                output_file_path = output_path / relative_path
+                self._make_parent(output_file_path, created_dirs)
+
+                if metadata.bundle is None:
+                    # Queue file for decryption
+                    encrypted_file_path = input_path / (
+                        relative_name + self.ENCRYPTED_EXTENSION
+                    )
+                    jobs.append(
+                        (
+                            idx,
+                            relative_name,
+                            metadata.original_size,
+                            (
+                                encrypted_file_path,
+                                output_file_path,
+                                metadata,
+                                self._buffering,
+                            ),
+                        )
+                    )
+                    continue
+
+                progress(relative_name)
+
+                try:
+                    # Extract file from its (decrypted) bundle
+                    if bundle is None or bundle[0] != metadata.bundle:
+                        if bundle is not None:
+                            self._close_bundle(*bundle[1:3])
+                            bundle = None
+                        bundle = self._read_bundle(input_path, metadata.bundle)
+
+                    tar_info = bundle[3].get(relative_path.as_posix())
+                    if tar_info is None:
+                        raise FileProcessingError(
+                            f"Bundled entry not found: {relative_path}"
+                        )
+                    member = bundle[1].extractfile(tar_info)
+                    if member is None:
+                        raise FileProcessingError(
+                            f"Bundled entry is not a file: {relative_path}"
+                        )
+                    with open(
+                        output_file_path, "wb", self._buffering
+                    ) as output_file:
+                        shutil.copyfileobj(member, output_file)
+                        self._restore_file(
+                            output_file, metadata, output_file.tell()
+                        )
 
                 except FileProcessingError:
                     raise
@@ -209,27 +566,426 @@ class FileProcessor:
                     raise FileProcessingError(
                         f"Failed to decrypt {relative_path}: {str(e)}"
                     ) from e
+        finally:
+            if bundle is not None:
+                self._close_bundle(*bundle[1:3])
+
+        # Decrypt queued files
+        self._run_jobs(_decrypt_one, jobs, progress)
+
+    @classmethod
+    def _make_parent(cls, file_path: Path, created_dirs: Set[Path]) -> None:
+        """Create a file's parent directory unless it was already created.
+
+        Args:
+            file_path: File about to be written.
+            created_dirs: Directories known to exist, updated in place.
+        """
+        cls._make_dir(file_path.parent, created_dirs)
+
+    @staticmethod
+    def _make_dir(dir_path: Path, created_dirs: Set[Path]) -> None:
+        """Create a directory and its parents unless they were already created.
+
+        Args:
+            dir_path: Directory to create.
+            created_dirs: Directories known to exist, updated in place.
+        """
+        if dir_path in created_dirs:
+            return
+
+        dir_path.mkdir(parents=True, exist_ok=True)
+
+        # Parents now exist too, so later siblings skip the mkdir call
+        while dir_path not in created_dirs:
+            created_dirs.add(dir_path)
+            if dir_path.parent == dir_path:
+                break
+            dir_path = dir_path.parent
+
+    @staticmethod
+    def _restore_file(
+        output_file: IO[bytes], metadata: FileMetadata, decrypted_size: int
+    ) -> None:
+        """Verify a decrypted file's size and restore its permissions.
+
+        Works on the still-open output file, so no extra path lookups are
+        needed.
+
+        Args:
+            output_file: Decrypted output file.
+            metadata: Metadata recorded for the file.
+            decrypted_size: Number of bytes written to the output file.
+
+        Raises:
+            FileProcessingError: If the size does not match the metadata.
+        """
+        # Verify decrypted size
+        if decrypted_size != metadata.original_size:
+            raise FileProcessingError(
+                f"Size mismatch for {metadata.relative_path}: "
+                f"expected {metadata.original_size}, got {decrypted_size}"
+            )
+
+        # Restore permissions if available
+        if metadata.permissions:
+            try:
+                if hasattr(os, "fchmod"):
+                    os.fchmod(output_file.fileno(), metadata.permissions)
+                else:
+                    os.chmod(output_file.name, metadata.permissions)
+            except Exception:
+                pass  # Ignore permission errors
 
-    def _collect_items(self, root_path: Path) -> List[Path]:
-        """Collect all files and directories in a folder.
+    @staticmethod
+    def _progress_counter(
+        total_items: Callable[[], int],
+        progress_callback: Optional[Callable[[str, int, int], None]],
+    ) -> Callable[[str], None]:
+        """Create a function reporting one more processed item.
+
+        Args:
+            total_items: Function returning the total number of items known
+                so far.
+            progress_callback: Optional callback(filename, current, total).
+
+        Returns:
+            Function to call with each item's name.
+        """
+        current = 0
+
+        def progress(name: str) -> None:
+            nonlocal current
+            current += 1
+            if progress_callback:
+                progress_callback(name, current, total_items())
+
+        return progress
+
+    def _run_jobs(
+        self,
+        worker: Callable[..., Any],
+        jobs: Iterable[Job],
+        progress: Callable[[str], None],
+    ) -> List[Tuple[int, Any]]:
+        """Run per-file jobs, in worker processes when more than one is allowed.
+
+        Files are independent, so with several workers each one is encrypted
+        or decrypted on its own CPU core. Consecutive small files are batched
+        up to ``JOB_BATCH_SIZE`` bytes per worker call. Jobs are consumed
+        lazily and each batch is started as soon as it is complete, so
+        ``jobs`` may still be producing (e.g. scanning) while earlier files
+        are processed.
+
+        Args:
+            worker: Module-level function called as
+                ``worker(crypto_engine, *args)``.
+            jobs: Iterable of (item index, name, size in bytes, args) tuples.
+            progress: Called with each job's name as it is processed.
+
+        Returns:
+            List of (item index, worker result) tuples.
+
+        Raises:
+            FileProcessingError: If a job fails.
+        """
+        results: List[Tuple[int, Any]] = []
+
+        if self.max_workers <= 1:
+            for idx, name, _, args in jobs:
+                progress(name)
+                results.append((idx, worker(self.crypto_engine, *args)))
+            return results
+
+        # Work that fits in one batch is not worth starting processes for
+        batches = self._batch_jobs(jobs)
+        first_batches = list(itertools.islice(batches, 2))
+        if len(first_batches) <= 1:
+            for batch in first_batches:
+                for idx, name, _, args in batch:
+                    progress(name)
+                    results.append((idx, worker(self.crypto_engine, *args)))
+            return results
+
+        # Spawn fresh interpreters rather than forking a process that may be
+        # running other threads (e.g. the GUI)
+        executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.crypto_engine,),
+        )
+        futures: Dict[Future, List[Job]] = {}
+        done: "queue.SimpleQueue[Future]" = queue.SimpleQueue()
+
+        def collect(future: Future) -> None:
+            batch = futures.pop(future)
+            try:
+                batch_results = future.result()
+            except FileProcessingError:
+                raise
+            except Exception as e:
+                raise FileProcessingError(
+                    f"Failed to process {batch[0][1]}: {str(e)}"
+                ) from e
+
+            for (idx, name, _, _), result in zip(batch, batch_results, strict=True):
+                progress(name)
+                results.append((idx, result))
+
+        try:
+            for batch in itertools.chain(first_batches, batches):
+                future = executor.submit(
+                    _run_batch, worker, [args for _, _, _, args in batch]
+                )
+                futures[future] = batch
+                future.add_done_callback(done.put)
+
+                # Report batches finished so far without waiting
+                while not done.empty():
+                    collect(done.get())
+
+            while futures:
+                collect(done.get())
+            return results
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _batch_jobs(self, jobs: Iterable[Job]) -> Iterator[List[Job]]:
+        """Group consecutive jobs into batches of about ``JOB_BATCH_SIZE`` bytes.
+
+        Args:
+            jobs: Iterable of (item index, name, size in bytes, args) tuples.
+
+        Yields:
+            Lists of jobs, each yielded as soon as it is full.
+        """
+        batch: List[Job] = []
+        batch_size = 0
+        for job in jobs:
+            batch.append(job)
+            batch_size += job[2]
+            if batch_size >= self.JOB_BATCH_SIZE:
+                yield batch
+                batch = []
+                batch_size = 0
+
+        if batch:
+            yield batch
+
+    def _iter_items(
+        self, root_path: Path, totals: _ScanTotals
+    ) -> Iterator[ScanItem]:
+        """Iterate over all files and directories in a folder as they are found.
+
+        Directories are listed with ``os.scandir`` on a thread pool running
+        in the background, each subdirectory being queued as soon as its
+        parent has been listed. Items are yielded one listing at a time, so
+        a directory always comes before its contents. Every entry is stat'ed
+        once here, so sizes and permissions need no further lookups.
 
         Args:
             root_path: Root folder path.
+            totals: Updated with the number of items and files found and
+                their total size, before each listing is yielded.
+
+        Yields:
+            (path, stat) pairs; the directories of each listing, then its
+            files, each in name order.
+        """
+        # (directories, files) of each listed directory, None once finished
+        listings: queue.SimpleQueue = queue.SimpleQueue()
+        errors: List[BaseException] = []
+        stop = threading.Event()
+
+        def scan() -> None:
+            try:
+                with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+                    pending = {executor.submit(self._scan_directory, root_path)}
+                    while pending and not stop.is_set():
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            directories, files, subdirectories = future.result()
+                            listings.put((directories, files))
+                            pending.update(
+                                executor.submit(self._scan_directory, subdirectory)
+                                for subdirectory in subdirectories
+                            )
+                    for future in pending:
+                        future.cancel()
+            except BaseException as e:
+                errors.append(e)
+            finally:
+                listings.put(None)
+
+        scan_thread = threading.Thread(target=scan, daemon=True)
+        scan_thread.start()
+        try:
+            while True:
+                listing = listings.get()
+                if listing is None:
+                    break
+
+                directories, files = listing
+                totals.items += len(directories) + len(files)
+                totals.files += len(files)
+                totals.size += sum(item_stat.st_size for _, item_stat in files)
+
+                # Directories first (for proper reconstruction), then files
+                directories.sort(key=lambda item: item[0])
+                files.sort(key=lambda item: item[0])
+                yield from directories
+                yield from files
+
+            if errors:
+                raise errors[0]
+        finally:
+            stop.set()
+            scan_thread.join()
+
+    @staticmethod
+    def _scan_directory(
+        path: Path,
+    ) -> Tuple[
+        List[Tuple[Path, os.stat_result]],
+        List[Tuple[Path, os.stat_result]],
+        List[Path],
+    ]:
+        """List a single directory.
+
+        Args:
+            path: Directory to list.
 
         Returns:
-            List of paths (directories first, then files).
+            Tuple of ((path, stat) pairs of directories; (path, stat) pairs
+            of files; subdirectories to descend into).
         """
         directories = []
         files = []
+        subdirectories = []
 
-        for item in root_path.rglob("*"):
-            if item.is_dir():
-                directories.append(item)
-            else:
-                files.append(item)
+        with os.scandir(path) as entries:
+            for entry in entries:
+                item = Path(entry.path)
+                item_stat = entry.stat()
+                if entry.is_dir():
+                    directories.append((item, item_stat))
+                    # Do not descend into symlinked directories
+                    if not entry.is_symlink():
+                        subdirectories.append(item)
+                else:
+                    files.append((item, item_stat))
+
+        return directories, files, subdirectories
+
+    def _bundle_name(self, index: int) -> str:
+        """Get the file name of an encrypted bundle.
+
+        Args:
+            index: Bundle index.
+
+        Returns:
+            Bundle file name.
+        """
+        return f"{self.BUNDLE_PREFIX}{index}{self.BUNDLE_EXTENSION}"
+
+    def _open_bundle(self) -> Tuple[tarfile.TarFile, IO[bytes]]:
+        """Start a new small-file bundle.
+
+        Returns:
+            Tuple of (tar archive, spooled buffer backing the archive).
+        """
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.BUNDLE_MAX_SIZE)
+        return tarfile.open(fileobj=buffer, mode="w"), buffer
+
+    def _write_bundle(
+        self,
+        output_path: Path,
+        index: int,
+        archive: tarfile.TarFile,
+        buffer: IO[bytes],
+    ) -> None:
+        """Encrypt a completed bundle into the output folder.
+
+        Args:
+            output_path: Output folder path.
+            index: Bundle index.
+            archive: Tar archive holding the bundled files.
+            buffer: Buffer backing the archive.
+
+        Raises:
+            FileProcessingError: If encryption fails.
+        """
+        bundle_name = self._bundle_name(index)
+
+        try:
+            archive.close()
+            buffer.seek(0)
+            with open(
+                output_path / bundle_name, "wb", self._buffering
+            ) as output_file:
+                # Use bundle name as associated data
+                self.crypto_engine.encrypt_file(
+                    buffer, output_file, bundle_name.encode("utf-8")
+                )
+        except Exception as e:
+            raise FileProcessingError(
+                f"Failed to encrypt {bundle_name}: {str(e)}"
+            ) from e
+        finally:
+            buffer.close()
 
-        # Return directories first, then files (for proper reconstruction)
-        return sorted(directories) + sorted(files)
+    def _read_bundle(
+        self, input_path: Path, index: int
+    ) -> Tuple[int, tarfile.TarFile, IO[bytes], Dict[str, tarfile.TarInfo]]:
+        """Decrypt a bundle and open it for extraction.
+
+        Args:
+            input_path: Encrypted folder path.
+            index: Bundle index.
+
+        Returns:
+            Tuple of (index, tar archive, spooled buffer backing the archive,
+            archive members by name).
+
+        Raises:
+            FileProcessingError: If the bundle is missing or decryption fails.
+        """
+        bundle_name = self._bundle_name(index)
+        bundle_path = input_path / bundle_name
+
+        if not bundle_path.exists():
+            raise FileProcessingError(f"Encrypted bundle not found: {bundle_path}")
+
+        buffer = tempfile.SpooledTemporaryFile(max_size=self.BUNDLE_MAX_SIZE)
+        try:
+            with open(bundle_path, "rb") as input_file:
+                _fadvise_input(input_file)
+                # Use bundle name as associated data
+                self.crypto_engine.decrypt_file(
+                    input_file, buffer, bundle_name.encode("utf-8")
+                )
+            buffer.seek(0)
+            archive = tarfile.open(fileobj=buffer, mode="r")
+            # Index members once; TarFile.getmember scans the whole list
+            members = {member.name: member for member in archive.getmembers()}
+            return index, archive, buffer, members
+        except Exception as e:
+            buffer.close()
+            raise FileProcessingError(
+                f"Failed to decrypt {bundle_name}: {str(e)}"
+            ) from e
+
+    @staticmethod
+    def _close_bundle(archive: tarfile.TarFile, buffer: IO[bytes]) -> None:
+        """Close an opened bundle and release its buffer.
+
+        Args:
+            archive: Tar archive.
+            buffer: Buffer backing the archive.
+        """
+        archive.close()
+        buffer.close()
 
     def _save_metadata(
         self, output_path: Path, metadata_list: List[FileMetadata]
@@ -244,13 +1000,19 @@ class FileProcessor:
             FileProcessingError: If saving fails.
         """
         try:
-            # Convert metadata to JSON
+            # Convert metadata to compact JSON, one value array per item
+            row = operator.attrgetter(*self.METADATA_FIELDS)
             metadata_dict = {
-                "version": 1,
-                "files": [asdict(m) for m in metadata_list],
+                "version": self.METADATA_VERSION,
+                "schema": self.METADATA_FIELDS,
+                "files": [row(m) for m in metadata_list],
             }
-            metadata_json = json.dumps(metadata_dict, indent=2)
-            metadata_bytes = metadata_json.encode("utf-8")
+            if orjson is not None:
+                metadata_bytes = orjson.dumps(metadata_dict)
+            else:
+                metadata_bytes = json.dumps(
+                    metadata_dict, separators=(",", ":")
+                ).encode("utf-8")
 
             # Encrypt metadata
             nonce = CryptoEngine.generate_nonce()
@@ -258,11 +1020,10 @@ class FileProcessor:
                 metadata_bytes, nonce
             )
 
-            # Write to file
+            # Write to file in a single unbuffered write
             metadata_path = output_path / self.METADATA_FILENAME
-            with open(metadata_path, "wb") as f:
-                f.write(nonce)
-                f.write(encrypted_metadata)
+            with open(metadata_path, "wb", buffering=0) as f:
+                f.write(nonce + encrypted_metadata)
 
         except Exception as e:
             raise FileProcessingError(
@@ -297,21 +1058,50 @@ class FileProcessor:
             metadata_bytes = self.crypto_engine.decrypt_metadata(
                 encrypted_metadata, nonce
             )
-            metadata_json = metadata_bytes.decode("utf-8")
-            metadata_dict = json.loads(metadata_json)
+            # Both decoders accept UTF-8 bytes directly
+            if orjson is not None:
+                metadata_dict = orjson.loads(metadata_bytes)
+            else:
+                metadata_dict = json.loads(metadata_bytes)
 
             # Validate version
-            if metadata_dict.get("version") != 1:
+            version = metadata_dict.get("version")
+            if version not in self.SUPPORTED_METADATA_VERSIONS:
                 raise InvalidMetadataError(
-                    f"Unsupported metadata version: {metadata_dict.get('version')}"
+                    f"Unsupported metadata version: {version}"
                 )
 
-            # Parse metadata
-            metadata_list = [
-                FileMetadata(**m) for m in metadata_dict.get("files", [])
-            ]
+            files = metadata_dict.get("files", [])
 
-            return metadata_list
+            if version == 1:
+                # Parse metadata (positional arguments, in field order)
+                return [
+                    FileMetadata(
+                        m["relative_path"],
+                        m["original_size"],
+                        m["encrypted_size"],
+                        m["is_directory"],
+                        m.get("permissions"),
+                        m.get("bundle"),
+                    )
+                    for m in files
+                ]
+
+            schema = tuple(metadata_dict["schema"])
+            if schema == self.METADATA_FIELDS:
+                return [FileMetadata(*values) for values in files]
+
+            # Written with a different field order or subset; a row that does
+            # not match the schema means the metadata is corrupted
+            try:
+                return [
+                    FileMetadata(**dict(zip(schema, values, strict=True)))
+                    for values in files
+                ]
+            except ValueError as e:
+                raise InvalidMetadataError(
+                    "Metadata entry does not match its schema"
+                ) from e
 
         except InvalidMetadataError:
             raise
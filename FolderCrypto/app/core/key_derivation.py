@@ -1,14 +1,64 @@
 """Secure key derivation from passwords using Argon2id."""
 
+import hashlib
 import os
-from typing import Tuple
+import struct
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional, Sequence, Tuple
 
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.backends import default_backend
 
 from .exceptions import InvalidPasswordError
 
+# Character class bits used to score password strength
+_UPPER = 1
+_LOWER = 2
+_DIGIT = 4
+_SPECIAL = 8
+
+
+def _char_classes(char: str) -> int:
+    """Get the character class bits of a single character.
+
+    Args:
+        char: Character to classify.
+
+    Returns:
+        Bitwise OR of the matching ``_UPPER``/``_LOWER``/``_DIGIT``/``_SPECIAL``.
+    """
+    return (
+        (_UPPER if char.isupper() else 0)
+        | (_LOWER if char.islower() else 0)
+        | (_DIGIT if char.isdigit() else 0)
+        | (_SPECIAL if not char.isalnum() else 0)
+    )
+
+
+# Precomputed classes of ASCII characters
+_ASCII_CLASSES = [_char_classes(chr(code)) for code in range(128)]
+
+
+def count_char_classes(password: str) -> int:
+    """Count the character classes used in a password.
+
+    Classes are upper case, lower case, digits and special characters,
+    collected in a single pass over the distinct characters.
+
+    Args:
+        password: Password to inspect.
+
+    Returns:
+        Number of classes present, from 0 to 4.
+    """
+    classes = 0
+    for char in set(password):
+        code = ord(char)
+        classes |= _ASCII_CLASSES[code] if code < 128 else _char_classes(char)
+    return bin(classes).count("1")
+
 
 class KeyDerivation:
     """Handles secure key derivation from passwords.
@@ -22,17 +72,46 @@ class KeyDerivation:
     SALT_SIZE = 32  # 256 bits
     KEY_SIZE = 32  # 256 bits for AES-256
 
-    def __init__(self, use_argon2: bool = False) -> None:
+    # Default Argon2id parameters (OWASP recommendations)
+    ARGON2_TIME_COST = 3  # iterations
+    ARGON2_MEMORY_COST = 65536  # 64 MB
+    ARGON2_PARALLELISM = 4  # threads
+
+    # Derived keys cached in memory by derive_key_cached, shared by all
+    # instances. Cache entries are indexed by a keyed BLAKE2b hash, so the
+    # index cannot be used to test password guesses without the process's
+    # random secret.
+    KEY_CACHE_SIZE = 8
+    _key_cache: "OrderedDict[bytes, bytearray]" = OrderedDict()
+    _key_cache_lock = threading.Lock()
+    _key_cache_secret = os.urandom(32)
+
+    def __init__(
+        self,
+        use_argon2: bool = False,
+        time_cost: Optional[int] = None,
+        memory_cost: Optional[int] = None,
+        parallelism: Optional[int] = None,
+    ) -> None:
         """Initialize key derivation.
 
+        The Argon2id parameters change the derived key, so a folder must be
+        decrypted with the parameters it was encrypted with.
+
         Args:
             use_argon2: Whether to use Argon2id (requires argon2-cffi).
+            time_cost: Argon2id iterations (default ``ARGON2_TIME_COST``).
+            memory_cost: Argon2id memory in KiB (default
+                ``ARGON2_MEMORY_COST``).
+            parallelism: Argon2id lanes (default ``ARGON2_PARALLELISM``).
         """
         self.use_argon2 = use_argon2
+        self.time_cost = time_cost or self.ARGON2_TIME_COST
+        self.memory_cost = memory_cost or self.ARGON2_MEMORY_COST
+        self.parallelism = parallelism or self.ARGON2_PARALLELISM
         
         if use_argon2:
             try:
-                from argon2 import PasswordHasher
                 from argon2.low_level import hash_secret_raw, Type
                 self._argon2_available = True
                 self._Type = Type
@@ -78,9 +157,115 @@ class KeyDerivation:
         else:
             return self._derive_key_pbkdf2(password_bytes, salt)
 
+    def derive_keys(
+        self,
+        pairs: Sequence[Tuple[str, bytes]],
+        max_workers: Optional[int] = None,
+    ) -> List[bytes]:
+        """Derive keys for several password and salt pairs concurrently.
+
+        Argon2id hashing releases the GIL, so the derivations run in
+        parallel on a thread pool. Each key is identical to the one
+        ``derive_key`` returns for the same pair.
+
+        Args:
+            pairs: (password, salt) pairs.
+            max_workers: Maximum number of threads (default: CPU count).
+
+        Returns:
+            Derived keys, in the order of ``pairs``.
+
+        Raises:
+            InvalidPasswordError: If any password or salt is invalid.
+        """
+        if len(pairs) <= 1:
+            return [self.derive_key(password, salt) for password, salt in pairs]
+
+        workers = min(max_workers or os.cpu_count() or 1, len(pairs))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda pair: self.derive_key(*pair), pairs)
+            )
+
+    def derive_key_cached(self, password: str, salt: bytes) -> bytes:
+        """Derive a key like ``derive_key``, reusing keys derived earlier.
+
+        Repeated unlocks with the same password, salt and KDF parameters in
+        one process skip the key derivation entirely. The most recently
+        used ``KEY_CACHE_SIZE`` keys are kept.
+
+        Args:
+            password: User password.
+            salt: Salt for key derivation.
+
+        Returns:
+            Derived key bytes.
+
+        Raises:
+            InvalidPasswordError: If password is invalid.
+        """
+        if not password:
+            raise InvalidPasswordError("Password cannot be empty")
+
+        cache_key = self._cache_key(password.encode("utf-8"), salt)
+
+        with self._key_cache_lock:
+            cached = self._key_cache.get(cache_key)
+            if cached is not None:
+                self._key_cache.move_to_end(cache_key)
+                return bytes(cached)
+
+        key = self.derive_key(password, salt)
+
+        with self._key_cache_lock:
+            self._key_cache[cache_key] = bytearray(key)
+            self._key_cache.move_to_end(cache_key)
+            while len(self._key_cache) > self.KEY_CACHE_SIZE:
+                _, evicted = self._key_cache.popitem(last=False)
+                evicted[:] = bytes(len(evicted))
+
+        return key
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Forget all cached keys, overwriting them in memory (best-effort)."""
+        with cls._key_cache_lock:
+            for cached in cls._key_cache.values():
+                cached[:] = bytes(len(cached))
+            cls._key_cache.clear()
+
+    def _cache_key(self, password: bytes, salt: bytes) -> bytes:
+        """Fingerprint a password, salt and the KDF parameters.
+
+        Args:
+            password: Password bytes.
+            salt: Salt bytes.
+
+        Returns:
+            Keyed hash identifying the derived key.
+        """
+        if self._argon2_available and self.use_argon2:
+            params = b"argon2id" + struct.pack(
+                "<III", self.time_cost, self.memory_cost, self.parallelism
+            )
+        else:
+            params = b"pbkdf2-sha256" + struct.pack("<I", self.PBKDF2_ITERATIONS)
+
+        digest = hashlib.blake2b(key=self._key_cache_secret, digest_size=32)
+        for part in (params, salt, password):
+            # Length-prefix each part so boundaries are unambiguous
+            digest.update(struct.pack("<I", len(part)))
+            digest.update(part)
+        return digest.digest()
+
     def _derive_key_pbkdf2(self, password: bytes, salt: bytes) -> bytes:
         """Derive key using PBKDF2-HMAC-SHA256.
 
+        The whole iteration loop runs inside OpenSSL, which uses the CPU's
+        SHA-256 instructions (SHA-NI, ARMv8 SHA2) when available. The result
+        is identical to ``hashlib.pbkdf2_hmac("sha256", ...)``, which is
+        slower with the OpenSSL builds Python usually links against.
+
         Args:
             password: Password bytes.
             salt: Salt bytes.
@@ -93,7 +278,6 @@ class KeyDerivation:
             length=self.KEY_SIZE,
             salt=salt,
             iterations=self.PBKDF2_ITERATIONS,
-            backend=default_backend(),
         )
         return kdf.derive(password)
 
@@ -107,13 +291,12 @@ class KeyDerivation:
         Returns:
             Derived key.
         """
-        # Argon2id parameters (OWASP recommendations)
         return self._hash_secret_raw(
             secret=password,
             salt=salt,
-            time_cost=3,  # iterations
-            memory_cost=65536,  # 64 MB
-            parallelism=4,  # threads
+            time_cost=self.time_cost,
+            memory_cost=self.memory_cost,
+            parallelism=self.parallelism,
             hash_len=self.KEY_SIZE,
             type=self._Type.ID,  # Argon2id
         )
@@ -133,12 +316,7 @@ class KeyDerivation:
         if len(password) < 12:
             return True, "Password is weak but acceptable"
 
-        has_upper = any(c.isupper() for c in password)
-        has_lower = any(c.islower() for c in password)
-        has_digit = any(c.isdigit() for c in password)
-        has_special = any(not c.isalnum() for c in password)
-
-        strength_score = sum([has_upper, has_lower, has_digit, has_special])
+        strength_score = count_char_classes(password)
 
         if strength_score >= 3:
             return True, "Password is strong"
@@ -1,9 +1,12 @@
 """Main window for FolderCrypto GUI application."""
 
+import os
 import sys
+import time
 import logging
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import Deque, Optional
 
 from PyQt6.QtWidgets import (
     QApplication,
@@ -22,7 +25,7 @@ from PyQt6.QtWidgets import (
     QMessageBox,
     QGroupBox,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont, QTextCursor
 
 from app.services.encrypt_service import EncryptService
@@ -46,6 +49,9 @@ class WorkerThread(QThread):
     finished = pyqtSignal(bool, str)  # success, message
     log = pyqtSignal(str)  # log message
 
+    # Minimum seconds between progress signals (~30 updates per second)
+    PROGRESS_INTERVAL = 1 / 30
+
     def __init__(
         self,
         operation: str,
@@ -72,10 +78,23 @@ class WorkerThread(QThread):
 
     def run(self):
         """Run the encryption/decryption operation."""
-        try:
-            def progress_callback(filename: str, current: int, total: int):
+        # Latest progress update not emitted yet, and time of the last emit
+        pending: Optional[tuple] = None
+        last_emit = 0.0
+
+        def progress_callback(filename: str, current: int, total: int):
+            # Coalesce per-file updates so the GUI event queue keeps up;
+            # the latest one is flushed when the operation ends
+            nonlocal pending, last_emit
+            now = time.monotonic()
+            if now - last_emit >= self.PROGRESS_INTERVAL:
                 self.progress.emit(filename, current, total)
+                pending = None
+                last_emit = now
+            else:
+                pending = (filename, current, total)
 
+        try:
             if self.operation == "encrypt":
                 self.log.emit("Starting encryption...")
                 service = EncryptService(use_argon2=self.use_argon2)
@@ -85,6 +104,8 @@ class WorkerThread(QThread):
                     self.password,
                     progress_callback=progress_callback,
                 )
+                if pending:
+                    self.progress.emit(*pending)
                 self.finished.emit(True, "Encryption completed successfully!")
             else:  # decrypt
                 self.log.emit("Starting decryption...")
@@ -95,6 +116,8 @@ class WorkerThread(QThread):
                     self.password,
                     progress_callback=progress_callback,
                 )
+                if pending:
+                    self.progress.emit(*pending)
                 self.finished.emit(True, "Decryption completed successfully!")
 
         except InvalidPasswordError as e:
@@ -111,6 +134,11 @@ class WorkerThread(QThread):
 class CryptoTab(QWidget):
     """Base tab for encryption/decryption operations."""
 
+    # Number of most recent lines kept in the log view
+    LOG_MAX_LINES = 500
+    # Milliseconds between refreshes of the log view
+    LOG_FLUSH_INTERVAL = 100
+
     def __init__(self, operation: str):
         """Initialize crypto tab.
 
@@ -122,6 +150,14 @@ class CryptoTab(QWidget):
         self.worker: Optional[WorkerThread] = None
         self.init_ui()
 
+        # Log lines are buffered and shown on a timer, so a burst of
+        # messages costs one redraw instead of one per line
+        self._log_lines: Deque[str] = deque(maxlen=self.LOG_MAX_LINES)
+        self._log_dirty = False
+        self._log_timer = QTimer(self)
+        self._log_timer.timeout.connect(self._flush_log)
+        self._log_timer.start(self.LOG_FLUSH_INTERVAL)
+
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout()
@@ -258,7 +294,16 @@ class CryptoTab(QWidget):
         Args:
             message: Message to log
         """
-        self.log_output.append(message)
+        self._log_lines.append(message)
+        self._log_dirty = True
+
+    def _flush_log(self):
+        """Show buffered log lines, keeping only the most recent ones."""
+        if not self._log_dirty:
+            return
+        self._log_dirty = False
+
+        self.log_output.setPlainText("\n".join(self._log_lines))
         # Auto-scroll to bottom
         cursor = self.log_output.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
@@ -270,23 +315,28 @@ class CryptoTab(QWidget):
         Returns:
             True if inputs are valid, False otherwise
         """
-        if not self.input_path.text():
+        # Read each field once
+        input_path = self.input_path.text()
+        output_path = self.output_path.text()
+        password = self.password_input.text()
+
+        if not input_path:
             QMessageBox.warning(self, "Input Error", "Please select an input folder.")
             return False
 
-        if not self.output_path.text():
+        if not output_path:
             QMessageBox.warning(self, "Input Error", "Please select an output folder.")
             return False
 
-        if not Path(self.input_path.text()).exists():
+        if not os.path.exists(input_path):
             QMessageBox.warning(self, "Input Error", "Input folder does not exist.")
             return False
 
-        if not self.password_input.text():
+        if not password:
             QMessageBox.warning(self, "Input Error", "Please enter a password.")
             return False
 
-        if len(self.password_input.text()) < 8:
+        if len(password) < 8:
             reply = QMessageBox.question(
                 self,
                 "Weak Password",
@@ -298,8 +348,7 @@ class CryptoTab(QWidget):
                 return False
 
         # Check if output folder exists and is not empty
-        output_path = Path(self.output_path.text())
-        if output_path.exists() and any(output_path.iterdir()):
+        if self._is_non_empty_dir(output_path):
             reply = QMessageBox.question(
                 self,
                 "Output Folder Exists",
@@ -312,6 +361,24 @@ class CryptoTab(QWidget):
 
         return True
 
+    @staticmethod
+    def _is_non_empty_dir(path: str) -> bool:
+        """Check whether a path is a directory with at least one entry.
+
+        Only the first entry is read, however large the directory is.
+
+        Args:
+            path: Path to check
+
+        Returns:
+            True if the path is a non-empty directory
+        """
+        try:
+            with os.scandir(path) as entries:
+                return next(entries, None) is not None
+        except OSError:
+            return False  # Missing or not a directory
+
     def start_operation(self):
         """Start encryption/decryption operation."""
         if not self.validate_inputs():
@@ -320,6 +387,7 @@ class CryptoTab(QWidget):
         # Disable UI during operation
         self.action_button.setEnabled(False)
         self.progress_bar.setValue(0)
+        self._log_lines.clear()
         self.log_output.clear()
         self.current_file_label.setText("Initializing...")
 
@@ -348,7 +416,7 @@ class CryptoTab(QWidget):
             percentage = int((current / total) * 100)
             self.progress_bar.setValue(percentage)
             self.current_file_label.setText(
-                f"Processing ({current}/{total}): {Path(filename).name}"
+                f"Processing ({current}/{total}): {os.path.basename(filename)}"
             )
             self.log_message(f"[{current}/{total}] {filename}")
 
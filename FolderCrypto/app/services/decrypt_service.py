@@ -1,8 +1,9 @@
 """Decryption service for folder decryption operations."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 
 from app.core.crypto_engine import CryptoEngine
 from app.core.key_derivation import KeyDerivation
@@ -20,18 +21,33 @@ logger = logging.getLogger(__name__)
 class DecryptService:
     """Service for decrypting folders."""
 
-    def __init__(self, use_argon2: bool = False) -> None:
+    def __init__(
+        self,
+        use_argon2: bool = False,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        write_buffer_size: Optional[int] = None,
+    ) -> None:
         """Initialize decryption service.
 
         Args:
             use_argon2: Whether to use Argon2id for key derivation.
+            max_workers: Number of processes decrypting files in parallel
+                (defaults to the number of CPUs).
+            chunk_size: Streaming chunk size in bytes (defaults to
+                ``CryptoEngine.CHUNK_SIZE``).
+            write_buffer_size: Buffer size in bytes for output files
+                (defaults to Python's default buffering).
         """
         self.key_derivation = KeyDerivation(use_argon2=use_argon2)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.write_buffer_size = write_buffer_size
 
     def decrypt_folder(
         self,
-        input_path: str,
-        output_path: str,
+        input_path: Union[str, os.PathLike],
+        output_path: Union[str, os.PathLike],
         password: str,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
     ) -> None:
@@ -49,6 +65,10 @@ class DecryptService:
             FileProcessingError: If file processing fails.
         """
         logger.info(f"Starting decryption: {input_path} -> {output_path}")
+        CryptoEngine.log_backend_info()
+
+        # Derived key, kept mutable so it can be overwritten when done
+        key: Optional[bytearray] = None
 
         try:
             # Convert paths
@@ -57,27 +77,40 @@ class DecryptService:
 
             # Load salt
             salt_file = input_path_obj / ".salt"
-            if not salt_file.exists():
-                raise DecryptionError("Salt file not found. Invalid encrypted folder.")
-
-            with open(salt_file, "rb") as f:
-                salt = f.read()
+            try:
+                # One unbuffered read; a longer file is detected by the size
+                # check below
+                fd = os.open(salt_file, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+            except FileNotFoundError as e:
+                raise DecryptionError(
+                    "Salt file not found. Invalid encrypted folder."
+                ) from e
+            try:
+                salt = os.read(fd, KeyDerivation.SALT_SIZE + 1)
+            finally:
+                os.close(fd)
 
             if len(salt) != KeyDerivation.SALT_SIZE:
                 raise DecryptionError("Invalid salt file. Corrupted encrypted folder.")
 
             logger.debug("Loaded salt from encrypted folder")
 
-            # Derive decryption key
+            # Derive decryption key (reused when unlocking the same folder again)
             try:
-                key = self.key_derivation.derive_key(password, salt)
+                key = bytearray(
+                    self.key_derivation.derive_key_cached(password, salt)
+                )
                 logger.debug("Derived decryption key from password")
             except InvalidPasswordError as e:
                 raise DecryptionError(f"Invalid password: {str(e)}") from e
 
             # Initialize crypto engine and file processor
-            crypto_engine = CryptoEngine(key)
-            file_processor = FileProcessor(crypto_engine)
+            crypto_engine = CryptoEngine(key, chunk_size=self.chunk_size)
+            file_processor = FileProcessor(
+                crypto_engine,
+                max_workers=self.max_workers,
+                write_buffer_size=self.write_buffer_size,
+            )
 
             # Decrypt folder
             logger.info("Decrypting folder contents...")
@@ -94,3 +127,7 @@ class DecryptService:
         except Exception as e:
             logger.error(f"Decryption failed: {str(e)}", exc_info=True)
             raise DecryptionError(f"Decryption failed: {str(e)}") from e
+        finally:
+            # Best-effort: clear this copy of the key from memory
+            if key is not None:
+                key[:] = bytes(len(key))
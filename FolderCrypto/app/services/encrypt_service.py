@@ -1,8 +1,9 @@
 """Encryption service for folder encryption operations."""
 
 import logging
+import os
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 
 from app.core.crypto_engine import CryptoEngine
 from app.core.key_derivation import KeyDerivation
@@ -24,22 +25,39 @@ class EncryptService:
         self,
         use_argon2: bool = False,
         verify_password_strength: bool = True,
+        bundle_small_files: bool = False,
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        write_buffer_size: Optional[int] = None,
     ) -> None:
         """Initialize encryption service.
 
         Args:
             use_argon2: Whether to use Argon2id for key derivation.
             verify_password_strength: Whether to verify password strength.
+            bundle_small_files: Whether to pack small files into encrypted
+                bundles instead of one encrypted file per input file.
+            max_workers: Number of processes encrypting files in parallel
+                (defaults to the number of CPUs).
+            chunk_size: Streaming chunk size in bytes (defaults to
+                ``CryptoEngine.CHUNK_SIZE``).
+            write_buffer_size: Buffer size in bytes for output files
+                (defaults to Python's default buffering).
         """
         self.key_derivation = KeyDerivation(use_argon2=use_argon2)
         self.verify_password_strength = verify_password_strength
+        self.bundle_small_files = bundle_small_files
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.write_buffer_size = write_buffer_size
 
     def encrypt_folder(
         self,
-        input_path: str,
-        output_path: str,
+        input_path: Union[str, os.PathLike],
+        output_path: Union[str, os.PathLike],
         password: str,
         progress_callback: Optional[Callable[[str, int, int], None]] = None,
+        info_callback: Optional[Callable[[int, int], None]] = None,
     ) -> None:
         """Encrypt a folder with a password.
 
@@ -48,6 +66,8 @@ class EncryptService:
             output_path: Path to output encrypted folder.
             password: Encryption password.
             progress_callback: Optional progress callback.
+            info_callback: Optional callback(total_files, total_bytes), called
+                once the input folder has been scanned.
 
         Raises:
             InvalidPasswordError: If password is invalid.
@@ -55,6 +75,7 @@ class EncryptService:
             FileProcessingError: If file processing fails.
         """
         logger.info(f"Starting encryption: {input_path} -> {output_path}")
+        CryptoEngine.log_backend_info()
 
         # Verify password strength
         if self.verify_password_strength:
@@ -63,18 +84,26 @@ class EncryptService:
                 raise InvalidPasswordError(message)
             logger.info(f"Password strength: {message}")
 
+        # Derived key, kept mutable so it can be overwritten when done
+        key: Optional[bytearray] = None
+
         try:
             # Generate salt
             salt = self.key_derivation.generate_salt()
             logger.debug("Generated salt for key derivation")
 
             # Derive encryption key
-            key = self.key_derivation.derive_key(password, salt)
+            key = bytearray(self.key_derivation.derive_key(password, salt))
             logger.debug("Derived encryption key from password")
 
             # Initialize crypto engine and file processor
-            crypto_engine = CryptoEngine(key)
-            file_processor = FileProcessor(crypto_engine)
+            crypto_engine = CryptoEngine(key, chunk_size=self.chunk_size)
+            file_processor = FileProcessor(
+                crypto_engine,
+                bundle_small_files=self.bundle_small_files,
+                max_workers=self.max_workers,
+                write_buffer_size=self.write_buffer_size,
+            )
 
             # Convert paths
             input_path_obj = Path(input_path).resolve()
@@ -86,11 +115,12 @@ class EncryptService:
                 input_path_obj,
                 output_path_obj,
                 progress_callback=progress_callback,
+                info_callback=info_callback,
             )
 
             # Save salt to a separate file
             salt_file = output_path_obj / ".salt"
-            with open(salt_file, "wb") as f:
+            with open(salt_file, "wb", buffering=0) as f:
                 f.write(salt)
 
             logger.info("Encryption completed successfully")
@@ -100,3 +130,7 @@ class EncryptService:
         except Exception as e:
             logger.error(f"Encryption failed: {str(e)}", exc_info=True)
             raise EncryptionError(f"Encryption failed: {str(e)}") from e
+        finally:
+            # Best-effort: clear this copy of the key from memory
+            if key is not None:
+                key[:] = bytes(len(key))
@@ -1,6 +1,6 @@
 """Utilities package."""
 
-from app.utils.config import ConfigManager
+from app.utils.config import ConfigManager, get_config_manager
 from app.utils.password_input import (
     get_password_interactive,
     get_password_with_confirmation,
@@ -10,6 +10,7 @@ from app.utils.password_input import (
 
 __all__ = [
     "ConfigManager",
+    "get_config_manager",
     "get_password_interactive",
     "get_password_with_confirmation",
     "get_password_simple",
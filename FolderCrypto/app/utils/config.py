@@ -2,11 +2,14 @@
 
 import configparser
 import logging
+import threading
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Tuple, TypeVar, cast
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class ConfigManager:
     """Manage application configuration from INI file."""
@@ -29,7 +32,9 @@ class ConfigManager:
             "confirm_overwrite": "true",
         },
         "Performance": {
-            "chunk_size": "65536",  # 64KB
+            "chunk_size": "1048576",  # 1 MB
+            "bundle_small_files": "false",
+            "workers": "0",  # 0 = number of CPUs
         },
     }
 
@@ -50,13 +55,48 @@ class ConfigManager:
             self.config_path = Path(config_path)
 
         self.config = configparser.ConfigParser()
+        # Snapshot of the parsed values, so lookups skip configparser
+        self._values: Dict[str, Dict[str, str]] = {}
+        # Converted values, keyed by (section, key, converter)
+        self._converted: Dict[Tuple[str, str, Callable[[str], Any]], Any] = {}
+        # (mtime_ns, size) of the file when it was last read or written
+        self._stat_key: Optional[Tuple[int, int]] = None
+        # Whether the parser holds changes not yet written to the file
+        self._dirty = False
         self.load()
 
     def load(self) -> None:
-        """Load configuration from file. Create default if missing."""
+        """Load configuration from file. Create default if missing.
+
+        The file is only parsed again if its modification time or size has
+        changed since it was last read or saved.
+        """
+        stat_key = self._file_stat_key()
+        if stat_key is not None and stat_key == self._stat_key:
+            return
+
+        self._load()
+        self._refresh_cache()
+
+    def _file_stat_key(self) -> Optional[Tuple[int, int]]:
+        """Get the modification time and size of the config file.
+
+        Returns:
+            (mtime_ns, size), or None if the file cannot be stat'ed.
+        """
+        try:
+            file_stat = self.config_path.stat()
+        except OSError:
+            return None
+        return file_stat.st_mtime_ns, file_stat.st_size
+
+    def _load(self) -> None:
+        """Read the configuration file into a fresh parser."""
+        self.config = configparser.ConfigParser()
         if self.config_path.exists():
             try:
                 self.config.read(self.config_path)
+                self._stat_key = self._file_stat_key()
                 logger.debug(f"Loaded configuration from {self.config_path}")
                 
                 # Ensure all default sections exist
@@ -68,21 +108,30 @@ class ConfigManager:
             logger.info(f"Config file not found. Creating default at {self.config_path}")
             self._create_default()
 
+    def _refresh_cache(self) -> None:
+        """Copy the parser's values into plain dictionaries."""
+        self._values = {
+            section: dict(self.config.items(section))
+            for section in self.config.sections()
+        }
+        self._converted.clear()
+
     def _ensure_defaults(self) -> None:
-        """Ensure all default sections and keys exist."""
-        modified = False
+        """Ensure all default sections and keys exist.
+
+        Missing defaults are only added in memory. They are written to the
+        file by the next ``save()`` or ``flush()``, so reading an older
+        config file does not rewrite it.
+        """
         for section, options in self.DEFAULT_CONFIG.items():
             if not self.config.has_section(section):
                 self.config.add_section(section)
-                modified = True
+                self._dirty = True
             
             for key, value in options.items():
                 if not self.config.has_option(section, key):
                     self.config.set(section, key, value)
-                    modified = True
-        
-        if modified:
-            self.save()
+                    self._dirty = True
 
     def _create_default(self) -> None:
         """Create default configuration file."""
@@ -101,12 +150,21 @@ class ConfigManager:
             
             with open(self.config_path, "w") as f:
                 self.config.write(f)
-            
+            self._stat_key = self._file_stat_key()
+            self._dirty = False
+
             logger.debug(f"Saved configuration to {self.config_path}")
         except Exception as e:
             logger.error(f"Failed to save config: {e}")
 
-    def get(self, section: str, key: str, fallback: Optional[str] = None) -> str:
+    def flush(self) -> None:
+        """Save configuration to file if it has unsaved changes."""
+        if self._dirty:
+            self.save()
+
+    def get(
+        self, section: str, key: str, fallback: Optional[str] = None
+    ) -> Optional[str]:
         """Get configuration value.
 
         Args:
@@ -115,9 +173,12 @@ class ConfigManager:
             fallback: Fallback value if key doesn't exist.
 
         Returns:
-            Configuration value.
+            Configuration value, or the fallback if the key doesn't exist.
         """
-        return self.config.get(section, key, fallback=fallback)
+        options = self._values.get(section)
+        if options is None:
+            return fallback
+        return options.get(self.config.optionxform(key), fallback)
 
     def get_bool(self, section: str, key: str, fallback: bool = False) -> bool:
         """Get boolean configuration value.
@@ -130,7 +191,7 @@ class ConfigManager:
         Returns:
             Boolean configuration value.
         """
-        return self.config.getboolean(section, key, fallback=fallback)
+        return self._get_converted(section, key, self._to_bool, fallback)
 
     def get_int(self, section: str, key: str, fallback: int = 0) -> int:
         """Get integer configuration value.
@@ -143,7 +204,62 @@ class ConfigManager:
         Returns:
             Integer configuration value.
         """
-        return self.config.getint(section, key, fallback=fallback)
+        return self._get_converted(section, key, int, fallback)
+
+    def _get_converted(
+        self,
+        section: str,
+        key: str,
+        convert: Callable[[str], T],
+        fallback: T,
+    ) -> T:
+        """Get a configuration value converted to another type.
+
+        Each value is converted once and cached until the configuration
+        changes.
+
+        Args:
+            section: Configuration section.
+            key: Configuration key.
+            convert: Function converting the stored string.
+            fallback: Fallback value if key doesn't exist.
+
+        Returns:
+            Converted configuration value.
+
+        Raises:
+            ValueError: If the stored value cannot be converted.
+        """
+        cache_key = (section, key, convert)
+        try:
+            return cast(T, self._converted[cache_key])
+        except KeyError:
+            pass
+
+        raw = self.get(section, key)
+        if raw is None:
+            return fallback
+
+        value = convert(raw)
+        self._converted[cache_key] = value
+        return value
+
+    def _to_bool(self, value: str) -> bool:
+        """Convert a string to a boolean the way configparser does.
+
+        Args:
+            value: Stored string value.
+
+        Returns:
+            Boolean value.
+
+        Raises:
+            ValueError: If the value is not a recognised boolean.
+        """
+        try:
+            return self.config.BOOLEAN_STATES[value.lower()]
+        except KeyError:
+            raise ValueError(f"Not a boolean: {value}") from None
 
     def set(self, section: str, key: str, value: str) -> None:
         """Set configuration value.
@@ -157,6 +273,8 @@ class ConfigManager:
             self.config.add_section(section)
         
         self.config.set(section, key, str(value))
+        self._dirty = True
+        self._refresh_cache()
 
     def get_all(self, section: str) -> Dict[str, str]:
         """Get all configuration values in a section.
@@ -167,9 +285,7 @@ class ConfigManager:
         Returns:
             Dictionary of configuration values.
         """
-        if self.config.has_section(section):
-            return dict(self.config.items(section))
-        return {}
+        return dict(self._values.get(section, {}))
 
     def update_last_paths(self, input_path: str, output_path: str) -> None:
         """Update last used paths.
@@ -217,3 +333,32 @@ class ConfigManager:
         """
         value = self.get("Folders", "last_output", "")
         return value if value else None
+
+
+# Shared managers returned by get_config_manager, keyed by config path
+_managers: Dict[Optional[Path], ConfigManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_config_manager(config_path: Optional[Path] = None) -> ConfigManager:
+    """Get the shared configuration manager for a config file.
+
+    The first call for a path creates the manager. Later calls return the
+    same instance, re-parsing the file only if it has changed on disk.
+
+    Args:
+        config_path: Path to config file. If None, uses default location.
+
+    Returns:
+        Configuration manager for the file.
+    """
+    key = Path(config_path) if config_path is not None else None
+
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = ConfigManager(key)
+            _managers[key] = manager
+        else:
+            manager.load()
+        return manager
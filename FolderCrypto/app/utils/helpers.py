@@ -5,6 +5,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 def format_size(size_bytes: int) -> str:
     """Format file size in human-readable format.
@@ -15,11 +17,13 @@ def format_size(size_bytes: int) -> str:
     Returns:
         Formatted size string.
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    # Each unit is 2**10 times the previous one, so the unit follows from
+    # the number of bits in the size
+    if size_bytes < 1024:
+        unit = 0
+    else:
+        unit = min(len(_SIZE_UNITS) - 1, (int(size_bytes).bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (10 * unit)):.2f} {_SIZE_UNITS[unit]}"
 
 
 def validate_path(path: str, must_exist: bool = False) -> Path:
@@ -80,12 +84,24 @@ def get_folder_size(path: Path) -> int:
         Total size in bytes.
     """
     total_size = 0
-    for item in path.rglob("*"):
-        if item.is_file():
-            try:
-                total_size += item.stat().st_size
-            except (OSError, PermissionError):
-                pass
+    # Walk with scandir, which gets entry types from the directory listing
+    # instead of stat'ing every path
+    pending = [os.fspath(path)]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        total_size += entry.stat().st_size
+                except OSError:
+                    pass
     return total_size
 
 
@@ -98,9 +114,21 @@ def create_backup_name(original_path: Path) -> Path:
     Returns:
         Backup path that doesn't exist.
     """
+    prefix = f"{original_path.name}.backup"
+
+    # List the directory once instead of probing each candidate name
+    parent = original_path.parent
+    try:
+        with os.scandir(parent) as entries:
+            taken = {
+                entry.name[len(prefix):]
+                for entry in entries
+                if entry.name.startswith(prefix)
+            }
+    except FileNotFoundError:
+        taken = set()
+
     counter = 1
-    while True:
-        backup_path = original_path.parent / f"{original_path.name}.backup{counter}"
-        if not backup_path.exists():
-            return backup_path
+    while str(counter) in taken:
         counter += 1
+    return parent / f"{prefix}{counter}"
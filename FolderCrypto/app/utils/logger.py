@@ -19,22 +19,48 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        """Initialize formatter.
+
+        Args:
+            fmt: Log format string.
+            datefmt: Date format string.
+        """
+        super().__init__(fmt, datefmt)
+
+        # One plain formatter per level, with the color codes baked into the
+        # format string, so formatting a record is a lookup and no string
+        # is rebuilt per record
+        fmt = self._fmt or "%(message)s"
+        reset = self.COLORS["RESET"]
+        self._level_formatters = {
+            level: logging.Formatter(
+                fmt.replace("%(levelname)s", f"{color}%(levelname)s{reset}"),
+                datefmt,
+            )
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
+        self._default_formatter = logging.Formatter(
+            fmt.replace("%(levelname)s", f"{reset}%(levelname)s{reset}"), datefmt
+        )
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors.
 
+        The record itself is left unchanged, so other handlers (e.g. the log
+        file) do not see the color codes.
+
         Args:
             record: Log record to format.
 
         Returns:
             Formatted log message.
         """
-        log_color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-        reset = self.COLORS["RESET"]
-
-        # Add color to level name
-        record.levelname = f"{log_color}{record.levelname}{reset}"
-
-        return super().format(record)
+        formatter = self._level_formatters.get(
+            record.levelname, self._default_formatter
+        )
+        return formatter.format(record)
 
 
 def setup_logging(
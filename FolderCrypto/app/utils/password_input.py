@@ -1,9 +1,26 @@
 """Enhanced password input with terminal UI."""
 
 import getpass
+import hmac
+import os
 import sys
 from typing import Optional
 
+from app.core.key_derivation import count_char_classes
+
+# Environment variable that supplies the password without prompting
+# (for scripts and CI; it is visible to other processes of the same user)
+PASSWORD_ENV_VAR = "FOLDERCRYPTO_PASSWORD"
+
+
+def _password_from_environment() -> Optional[str]:
+    """Get the password from ``PASSWORD_ENV_VAR``, if set.
+
+    Returns:
+        Password, or None if the variable is unset or empty.
+    """
+    return os.environ.get(PASSWORD_ENV_VAR) or None
+
 
 def get_password_with_confirmation(prompt: str = "Enter password: ") -> str:
     """Get password with confirmation.
@@ -17,6 +34,10 @@ def get_password_with_confirmation(prompt: str = "Enter password: ") -> str:
     Raises:
         ValueError: If passwords don't match or password is empty.
     """
+    password = _password_from_environment()
+    if password:
+        return password
+
     while True:
         password = getpass.getpass(prompt)
         
@@ -29,7 +50,8 @@ def get_password_with_confirmation(prompt: str = "Enter password: ") -> str:
         
         confirm = getpass.getpass("Confirm password: ")
         
-        if password == confirm:
+        # Constant-time comparison
+        if hmac.compare_digest(password.encode("utf-8"), confirm.encode("utf-8")):
             return password
         
         print("ERROR: Passwords do not match", file=sys.stderr)
@@ -50,6 +72,10 @@ def get_password_simple(prompt: str = "Enter password: ") -> str:
     Raises:
         ValueError: If password is empty.
     """
+    password = _password_from_environment()
+    if password:
+        return password
+
     password = getpass.getpass(prompt)
     
     if not password:
@@ -64,6 +90,8 @@ def get_password_interactive(
 ) -> str:
     """Get password with interactive terminal UI.
 
+    If ``PASSWORD_ENV_VAR`` is set, its value is returned without prompting.
+
     Args:
         mode: Operation mode ('encrypt' or 'decrypt').
         custom_prompt: Custom prompt text (optional).
@@ -74,6 +102,10 @@ def get_password_interactive(
     Raises:
         ValueError: If password validation fails.
     """
+    password = _password_from_environment()
+    if password:
+        return password
+
     print("\n" + "=" * 60)
     print(f"{mode.upper()} - Password Required")
     print("=" * 60)
@@ -100,12 +132,8 @@ def display_password_strength(password: str) -> None:
         password: Password to check.
     """
     length = len(password)
-    has_upper = any(c.isupper() for c in password)
-    has_lower = any(c.islower() for c in password)
-    has_digit = any(c.isdigit() for c in password)
-    has_special = any(not c.isalnum() for c in password)
-    
-    strength = sum([has_upper, has_lower, has_digit, has_special])
+
+    strength = count_char_classes(password)
     
     if length < 8:
         level = "Very Weak"
@@ -2,5 +2,10 @@
 """Launcher script for FolderCrypto GUI application."""
 
 if __name__ == "__main__":
+    import multiprocessing
+
+    # Worker processes re-run the entry point in frozen executables
+    multiprocessing.freeze_support()
+
     from app.gui.main_window import main
     main()
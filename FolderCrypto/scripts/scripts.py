@@ -3,15 +3,28 @@ Makefile-style command runner for development tasks.
 Usage: python scripts.py <command>
 """
 
+import os
 import sys
+import shlex
+import shutil
 import subprocess
+from fnmatch import fnmatch
 from pathlib import Path
 
 
+# Exit status reported when a command's program is not installed, as a
+# shell would
+COMMAND_NOT_FOUND = 127
+
+
 def run(cmd: str) -> int:
-    """Run a shell command."""
+    """Run a command directly, without a shell."""
     print(f"→ {cmd}")
-    return subprocess.call(cmd, shell=True)
+    try:
+        return subprocess.call(shlex.split(cmd))
+    except FileNotFoundError:
+        print(f"Command not found: {shlex.split(cmd)[0]}")
+        return COMMAND_NOT_FOUND
 
 
 def test() -> int:
@@ -52,12 +65,35 @@ def check() -> int:
         ("Tests", "pytest --tb=short"),
     ]
 
-    failed = []
+    # The checks are independent, so run them all at once and print each
+    # one's captured output in order as it finishes
+    processes = []
     for name, cmd in commands:
+        try:
+            process = subprocess.Popen(
+                shlex.split(cmd),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        except FileNotFoundError:
+            process = None
+        processes.append((name, cmd, process))
+
+    failed = []
+    for name, cmd, process in processes:
         print(f"\n{'=' * 60}")
         print(f"Running: {name}")
         print(f"{'=' * 60}")
-        if run(cmd) != 0:
+        print(f"→ {cmd}")
+        if process is None:
+            print(f"Command not found: {shlex.split(cmd)[0]}")
+            failed.append(name)
+            continue
+
+        output, _ = process.communicate()
+        print(output, end="")
+        if process.returncode != 0:
             failed.append(name)
 
     print(f"\n{'=' * 60}")
@@ -72,8 +108,8 @@ def check() -> int:
 def clean() -> int:
     """Clean generated files."""
     patterns = [
-        "**/__pycache__",
-        "**/*.pyc",
+        "__pycache__",
+        "*.pyc",
         ".pytest_cache",
         ".mypy_cache",
         ".ruff_cache",
@@ -84,15 +120,27 @@ def clean() -> int:
         "*.egg-info",
     ]
 
-    for pattern in patterns:
-        for path in Path(".").rglob(pattern):
-            if path.is_file():
+    def matches(name: str) -> bool:
+        return any(fnmatch(name, pattern) for pattern in patterns)
+
+    # Single walk over the tree, matching names at any depth
+    for root, dirs, files in os.walk("."):
+        for name in files:
+            if matches(name):
+                path = Path(root, name)
                 path.unlink()
                 print(f"Removed: {path}")
-            elif path.is_dir():
-                import shutil
+
+        # Prune removed directories so the walk does not descend into them
+        kept = []
+        for name in dirs:
+            path = Path(root, name)
+            if matches(name) and not path.is_symlink():
                 shutil.rmtree(path)
                 print(f"Removed: {path}/")
+            else:
+                kept.append(name)
+        dirs[:] = kept
 
     return 0
 
@@ -1,25 +1,84 @@
 """Test configuration and fixtures."""
 
+import os
 import pytest
 import tempfile
 import shutil
 from pathlib import Path
 
+from app.core.crypto_engine import CryptoEngine
+from app.core.key_derivation import KeyDerivation
+from app.services.decrypt_service import DecryptService
+from app.services.encrypt_service import EncryptService
+
+# PBKDF2 iterations used by tests not marked ``real_kdf``
+TEST_PBKDF2_ITERATIONS = 1000
+
+SAMPLE_PASSWORD = "TestPassword123!@#"
+
+
+@pytest.fixture(autouse=True)
+def fast_kdf(request, monkeypatch):
+    """Run PBKDF2 with few iterations unless the test is marked real_kdf.
+
+    Key derivation dominates the run time of the service and integration
+    tests; the full iteration count adds nothing to what they check.
+    """
+    if request.node.get_closest_marker("real_kdf") is None:
+        monkeypatch.setattr(
+            KeyDerivation, "PBKDF2_ITERATIONS", TEST_PBKDF2_ITERATIONS
+        )
+
+
+# RAM-backed directory for test files where available (Linux), so file
+# round trips do not wait on the disk
+SHM_DIR = Path("/dev/shm")
+TEMP_BASE = (
+    str(SHM_DIR) if SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK) else None
+)
+
 
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
-    temp_path = Path(tempfile.mkdtemp())
+    temp_path = Path(tempfile.mkdtemp(dir=TEMP_BASE))
     yield temp_path
     # Cleanup
     if temp_path.exists():
         shutil.rmtree(temp_path)
 
 
+@pytest.fixture(scope="module")
+def crypto_engine():
+    """Crypto engine with a random key, shared by the tests of a module."""
+    return CryptoEngine(os.urandom(CryptoEngine.KEY_SIZE))
+
+
+@pytest.fixture(scope="module")
+def crypto_engine_alt():
+    """Second crypto engine with a different random key."""
+    return CryptoEngine(os.urandom(CryptoEngine.KEY_SIZE))
+
+
+@pytest.fixture(scope="module")
+def encrypt_service():
+    """Encryption service without password strength checks, per module.
+
+    Services keep no state between calls, so tests can share one.
+    """
+    return EncryptService(verify_password_strength=False)
+
+
+@pytest.fixture(scope="module")
+def decrypt_service():
+    """Decryption service with default settings, per module."""
+    return DecryptService()
+
+
 @pytest.fixture
 def sample_password():
     """Sample password for tests."""
-    return "TestPassword123!@#"
+    return SAMPLE_PASSWORD
 
 
 @pytest.fixture
@@ -28,21 +87,96 @@ def weak_password():
     return "weak"
 
 
+# Sample files and their contents, by path relative to the sample folder
+SAMPLE_FILES = {
+    "file1.txt": b"Hello World!",
+    "folder1/file2.txt": b"Test content in folder1",
+    "folder1/subfolder/file3.txt": b"Nested file content",
+    "folder2/file4.txt": b"Another test file",
+    "binary.bin": b"\x00\x01\x02\x03" * 1000,
+}
+
+
+def _create_sample_files(root: Path) -> None:
+    """Create the sample folder structure under a directory.
+
+    Args:
+        root: Existing directory to populate.
+    """
+    for rel_path, content in SAMPLE_FILES.items():
+        path = root / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(content)
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link a file, falling back to a copy (e.g. across devices)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+@pytest.fixture(scope="session")
+def sample_files_master():
+    """Sample folder built once per session; tests must not modify it."""
+    root = Path(tempfile.mkdtemp(dir=TEMP_BASE))
+    _create_sample_files(root)
+    yield root
+    shutil.rmtree(root)
+
+
+@pytest.fixture(scope="session")
+def sample_file_list():
+    """Paths of the sample files, relative to the sample folder."""
+    return tuple(SAMPLE_FILES)
+
+
 @pytest.fixture
-def sample_files(temp_dir):
-    """Create sample files for testing."""
-    # Create directory structure
-    (temp_dir / "folder1").mkdir()
-    (temp_dir / "folder1" / "subfolder").mkdir()
-    (temp_dir / "folder2").mkdir()
-
-    # Create files with different sizes
-    (temp_dir / "file1.txt").write_text("Hello World!")
-    (temp_dir / "folder1" / "file2.txt").write_text("Test content in folder1")
-    (temp_dir / "folder1" / "subfolder" / "file3.txt").write_text("Nested file content")
-    (temp_dir / "folder2" / "file4.txt").write_text("Another test file")
-
-    # Create a binary file
-    (temp_dir / "binary.bin").write_bytes(b"\x00\x01\x02\x03" * 1000)
+def sample_files(temp_dir, sample_files_master):
+    """Create sample files for testing.
 
+    Files are hard links to ``sample_files_master`` where possible, so they
+    must be replaced rather than rewritten in place.
+    """
+    shutil.copytree(
+        sample_files_master,
+        temp_dir,
+        copy_function=_link_or_copy,
+        dirs_exist_ok=True,
+    )
     return temp_dir
+
+
+@pytest.fixture(scope="module")
+def encrypted_sample_dir(sample_files_master):
+    """Sample files encrypted with ``SAMPLE_PASSWORD``, once per module.
+
+    Tests must not modify it; use ``encrypted_sample`` for a private copy.
+    Created next to the ``temp_dir`` directories so copies can hard-link.
+    """
+    root = Path(tempfile.mkdtemp(dir=TEMP_BASE))
+    output = root / "encrypted"
+
+    # Match the iteration count fast_kdf gives the decrypting tests
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            KeyDerivation, "PBKDF2_ITERATIONS", TEST_PBKDF2_ITERATIONS
+        )
+        EncryptService(verify_password_strength=False).encrypt_folder(
+            sample_files_master, output, SAMPLE_PASSWORD
+        )
+    yield output
+    shutil.rmtree(root)
+
+
+@pytest.fixture
+def encrypted_sample(temp_dir, encrypted_sample_dir):
+    """Copy of ``encrypted_sample_dir`` at ``temp_dir / "encrypted"``.
+
+    Files are hard links where possible, so they must be replaced rather
+    than rewritten in place.
+    """
+    encrypted_dir = temp_dir / "encrypted"
+    shutil.copytree(encrypted_sample_dir, encrypted_dir, copy_function=_link_or_copy)
+    return encrypted_dir
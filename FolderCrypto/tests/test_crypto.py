@@ -1,9 +1,13 @@
 """Tests for cryptographic components."""
 
 import pytest
+import hashlib
 import os
+import struct
 from io import BytesIO
 
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
 from app.core.crypto_engine import CryptoEngine
 from app.core.key_derivation import KeyDerivation
 from app.core.exceptions import (
@@ -28,6 +32,7 @@ class TestKeyDerivation:
         salt2 = kd.generate_salt()
         assert salt != salt2
 
+    @pytest.mark.real_kdf
     def test_derive_key_pbkdf2(self, sample_password):
         """Test key derivation with PBKDF2."""
         kd = KeyDerivation(use_argon2=False)
@@ -38,6 +43,39 @@ class TestKeyDerivation:
         assert len(key) == KeyDerivation.KEY_SIZE
         assert isinstance(key, bytes)
 
+    def test_derive_key_pbkdf2_matches_hashlib(self, sample_password, monkeypatch):
+        """Test PBKDF2 keys match the standard library implementation."""
+        monkeypatch.setattr(KeyDerivation, "PBKDF2_ITERATIONS", 1000)
+        kd = KeyDerivation(use_argon2=False)
+        salt = kd.generate_salt()
+
+        key = kd.derive_key(sample_password, salt)
+
+        assert key == hashlib.pbkdf2_hmac(
+            "sha256",
+            sample_password.encode("utf-8"),
+            salt,
+            1000,
+            KeyDerivation.KEY_SIZE,
+        )
+
+    def test_derive_key_argon2_parameters(self, sample_password):
+        """Test Argon2id parameters are configurable and change the key."""
+        pytest.importorskip("argon2")
+        salt = KeyDerivation().generate_salt()
+
+        light = KeyDerivation(
+            use_argon2=True, time_cost=1, memory_cost=8192, parallelism=1
+        )
+        heavier = KeyDerivation(
+            use_argon2=True, time_cost=2, memory_cost=8192, parallelism=1
+        )
+
+        key = light.derive_key(sample_password, salt)
+        assert len(key) == KeyDerivation.KEY_SIZE
+        assert key == light.derive_key(sample_password, salt)
+        assert key != heavier.derive_key(sample_password, salt)
+
     def test_derive_key_deterministic(self, sample_password):
         """Test that key derivation is deterministic."""
         kd = KeyDerivation(use_argon2=False)
@@ -48,6 +86,43 @@ class TestKeyDerivation:
 
         assert key1 == key2
 
+    def test_derive_key_cached(self, sample_password, monkeypatch):
+        """Test cached key derivation runs the KDF once per password and salt."""
+        KeyDerivation.clear_cache()
+        kd = KeyDerivation(use_argon2=False)
+        salt = kd.generate_salt()
+        expected = kd.derive_key(sample_password, salt)
+
+        calls = []
+        derive = kd._derive_key_pbkdf2
+        monkeypatch.setattr(
+            kd, "_derive_key_pbkdf2", lambda *args: calls.append(1) or derive(*args)
+        )
+
+        assert kd.derive_key_cached(sample_password, salt) == expected
+        assert kd.derive_key_cached(sample_password, salt) == expected
+        assert len(calls) == 1
+
+        # Different password is not served from the cache
+        assert kd.derive_key_cached("other password", salt) != expected
+        assert len(calls) == 2
+
+        KeyDerivation.clear_cache()
+        kd.derive_key_cached(sample_password, salt)
+        assert len(calls) == 3
+
+    def test_derive_keys(self):
+        """Test batched key derivation matches derive_key for each pair."""
+        kd = KeyDerivation(use_argon2=False)
+        pairs = [(f"password{i}", kd.generate_salt()) for i in range(3)]
+
+        keys = kd.derive_keys(pairs, max_workers=2)
+
+        assert keys == [kd.derive_key(password, salt) for password, salt in pairs]
+
+        with pytest.raises(InvalidPasswordError):
+            kd.derive_keys(pairs + [("", kd.generate_salt())])
+
     def test_derive_key_different_passwords(self):
         """Test different passwords produce different keys."""
         kd = KeyDerivation(use_argon2=False)
@@ -101,6 +176,11 @@ class TestKeyDerivation:
         assert is_valid
         assert "strong" in msg.lower()
 
+        # Non-ASCII characters are classified too
+        is_valid, msg = kd.verify_password_strength("ÄÖÜäöüßéèêàç")
+        assert is_valid
+        assert "moderate" in msg.lower()
+
 
 class TestCryptoEngine:
     """Tests for CryptoEngine class."""
@@ -116,10 +196,9 @@ class TestCryptoEngine:
         nonce2 = CryptoEngine.generate_nonce()
         assert nonce != nonce2
 
-    def test_encrypt_decrypt_small_file(self):
+    def test_encrypt_decrypt_small_file(self, crypto_engine):
         """Test encryption and decryption of small file."""
-        key = os.urandom(CryptoEngine.KEY_SIZE)
-        crypto = CryptoEngine(key)
+        crypto = crypto_engine
 
         # Create test data
         test_data = b"Hello, World! This is a test."
@@ -143,10 +222,9 @@ class TestCryptoEngine:
         decrypted_data = decrypted_file.getvalue()
         assert decrypted_data == test_data
 
-    def test_encrypt_decrypt_large_file(self):
+    def test_encrypt_decrypt_large_file(self, crypto_engine):
         """Test encryption and decryption of large file (multiple chunks)."""
-        key = os.urandom(CryptoEngine.KEY_SIZE)
-        crypto = CryptoEngine(key)
+        crypto = crypto_engine
 
         # Create large test data (multiple chunks)
         test_data = os.urandom(CryptoEngine.CHUNK_SIZE * 3 + 1000)
@@ -164,11 +242,140 @@ class TestCryptoEngine:
         # Verify
         assert decrypted_file.getvalue() == test_data
 
-    def test_encrypt_with_associated_data(self):
-        """Test encryption with associated data."""
+    def test_encrypt_decrypt_pipelined_file(self, crypto_engine):
+        """Test files large enough for the overlapped read/encrypt/write path."""
+        crypto = crypto_engine
+
+        test_data = os.urandom(CryptoEngine.PIPELINE_MIN_SIZE * 2 + 1000)
+        input_file = BytesIO(test_data)
+        encrypted_file = BytesIO()
+
+        crypto.encrypt_file(input_file, encrypted_file, b"pipelined")
+
+        encrypted_file.seek(0)
+        decrypted_file = BytesIO()
+        crypto.decrypt_file(encrypted_file, decrypted_file, b"pipelined")
+
+        assert decrypted_file.getvalue() == test_data
+
+    def test_one_shot_matches_stream_format(self, monkeypatch):
+        """Test small files encrypted in one call decrypt as a GCM stream."""
+        key = os.urandom(CryptoEngine.KEY_SIZE)
+        crypto = CryptoEngine(key, cipher=CryptoEngine.CIPHER_AES_GCM)
+
+        test_data = os.urandom(1000)
+        encrypted_file = BytesIO()
+        crypto.encrypt_file(BytesIO(test_data), encrypted_file, b"ad")
+
+        # Force the streaming decryptor for the same file
+        monkeypatch.setattr(CryptoEngine, "ONE_SHOT_MAX_SIZE", 0)
+        encrypted_file.seek(0)
+        decrypted_file = BytesIO()
+        crypto.decrypt_file(encrypted_file, decrypted_file, b"ad")
+
+        assert decrypted_file.getvalue() == test_data
+
+    def test_encrypt_decrypt_mapped_file(self, temp_dir, crypto_engine):
+        """Test large on-disk files encrypted from a memory map."""
+        crypto = crypto_engine
+
+        test_data = os.urandom(CryptoEngine.MMAP_MIN_SIZE * 2 + 1000)
+        input_path = temp_dir / "input.bin"
+        encrypted_path = temp_dir / "input.bin.encrypted"
+        input_path.write_bytes(test_data)
+
+        with open(input_path, "rb") as fin, open(encrypted_path, "wb") as fout:
+            encrypted_size = crypto.encrypt_file(fin, fout)
+
+        with open(encrypted_path, "rb") as fin:
+            decrypted_file = BytesIO()
+            decrypted_size = crypto.decrypt_file(fin, decrypted_file)
+
+        assert decrypted_file.getvalue() == test_data
+        assert encrypted_size == encrypted_path.stat().st_size
+        assert decrypted_size == len(test_data)
+
+    def test_reported_sizes(self):
+        """Test encrypt and decrypt return the number of bytes written."""
+        key = os.urandom(CryptoEngine.KEY_SIZE)
+
+        for cipher in (
+            CryptoEngine.CIPHER_AES_GCM,
+            CryptoEngine.CIPHER_CHACHA20_POLY1305,
+        ):
+            crypto = CryptoEngine(key, cipher=cipher)
+            for size in (0, 1000, CryptoEngine.PIPELINE_MIN_SIZE + 1000):
+                test_data = os.urandom(size)
+                encrypted_file = BytesIO()
+                encrypted_size = crypto.encrypt_file(
+                    BytesIO(test_data), encrypted_file
+                )
+                assert encrypted_size == len(encrypted_file.getvalue())
+
+                encrypted_file.seek(0)
+                decrypted_file = BytesIO()
+                assert crypto.decrypt_file(encrypted_file, decrypted_file) == size
+                assert decrypted_file.getvalue() == test_data
+
+    def test_encrypt_decrypt_chacha20(self):
+        """Test ChaCha20-Poly1305 files decrypt with any engine for the key."""
+        key = os.urandom(CryptoEngine.KEY_SIZE)
+        chacha = CryptoEngine(key, cipher=CryptoEngine.CIPHER_CHACHA20_POLY1305)
+        aes = CryptoEngine(key, cipher=CryptoEngine.CIPHER_AES_GCM)
+
+        test_data = os.urandom(CryptoEngine.CHUNK_SIZE + 1000)
+        input_file = BytesIO(test_data)
+        encrypted_file = BytesIO()
+
+        chacha.encrypt_file(input_file, encrypted_file)
+
+        # Cipher is selected from the file header
+        encrypted_file.seek(0)
+        decrypted_file = BytesIO()
+        aes.decrypt_file(encrypted_file, decrypted_file)
+
+        assert decrypted_file.getvalue() == test_data
+
+    def test_decrypt_chacha20_truncated_large_file(self):
+        """Test truncated chunk-framed files fail while reading ahead."""
+        key = os.urandom(CryptoEngine.KEY_SIZE)
+        crypto = CryptoEngine(key, cipher=CryptoEngine.CIPHER_CHACHA20_POLY1305)
+
+        encrypted_file = BytesIO()
+        crypto.encrypt_file(
+            BytesIO(os.urandom(CryptoEngine.PIPELINE_MIN_SIZE + 1000)),
+            encrypted_file,
+        )
+        truncated = BytesIO(encrypted_file.getvalue()[:-10])
+
+        with pytest.raises(DecryptionError):
+            crypto.decrypt_file(truncated, BytesIO())
+
+    def test_decrypt_version1_file(self):
+        """Test files written before the cipher header byte still decrypt."""
         key = os.urandom(CryptoEngine.KEY_SIZE)
         crypto = CryptoEngine(key)
 
+        test_data = b"Version 1 data"
+        nonce = CryptoEngine.generate_nonce()
+        chunk = AESGCM(key).encrypt(nonce, test_data, struct.pack("<Q", 0))
+        encrypted_file = BytesIO(
+            struct.pack("B", 1)
+            + nonce
+            + struct.pack("<Q", len(test_data))
+            + struct.pack("<I", len(chunk))
+            + chunk
+        )
+
+        decrypted_file = BytesIO()
+        crypto.decrypt_file(encrypted_file, decrypted_file)
+
+        assert decrypted_file.getvalue() == test_data
+
+    def test_encrypt_with_associated_data(self, crypto_engine):
+        """Test encryption with associated data."""
+        crypto = crypto_engine
+
         test_data = b"Test data"
         associated_data = b"metadata"
 
@@ -191,13 +398,10 @@ class TestCryptoEngine:
         with pytest.raises(DecryptionError):
             crypto.decrypt_file(encrypted_file, decrypted_file2, b"wrong")
 
-    def test_decrypt_wrong_key(self):
+    def test_decrypt_wrong_key(self, crypto_engine, crypto_engine_alt):
         """Test decryption with wrong key fails."""
-        key1 = os.urandom(CryptoEngine.KEY_SIZE)
-        key2 = os.urandom(CryptoEngine.KEY_SIZE)
-
-        crypto1 = CryptoEngine(key1)
-        crypto2 = CryptoEngine(key2)
+        crypto1 = crypto_engine
+        crypto2 = crypto_engine_alt
 
         test_data = b"Test data"
         input_file = BytesIO(test_data)
@@ -213,10 +417,9 @@ class TestCryptoEngine:
         with pytest.raises(DecryptionError):
             crypto2.decrypt_file(encrypted_file, decrypted_file)
 
-    def test_decrypt_corrupted_data(self):
+    def test_decrypt_corrupted_data(self, crypto_engine):
         """Test decryption of corrupted data fails."""
-        key = os.urandom(CryptoEngine.KEY_SIZE)
-        crypto = CryptoEngine(key)
+        crypto = crypto_engine
 
         test_data = b"Test data for corruption check"
         input_file = BytesIO(test_data)
@@ -227,8 +430,9 @@ class TestCryptoEngine:
 
         # Corrupt encrypted data (flip bits in the middle of encrypted content)
         encrypted_data = bytearray(encrypted_file.getvalue())
-        # Corrupt at a safe index (after header: 1 byte version + 12 bytes nonce + 8 bytes size = 21)
-        corruption_index = min(25, len(encrypted_data) - 1)
+        # Corrupt the first ciphertext byte (v3 layout: 22-byte header of
+        # version, cipher, nonce and size, then the ciphertext and its tag)
+        corruption_index = CryptoEngine.HEADER_SIZE
         encrypted_data[corruption_index] ^= 0xFF  # Flip bits
         corrupted_file = BytesIO(bytes(encrypted_data))
 
@@ -237,10 +441,9 @@ class TestCryptoEngine:
         with pytest.raises(DecryptionError):
             crypto.decrypt_file(corrupted_file, decrypted_file)
 
-    def test_encrypt_metadata(self):
+    def test_encrypt_metadata(self, crypto_engine):
         """Test metadata encryption and decryption."""
-        key = os.urandom(CryptoEngine.KEY_SIZE)
-        crypto = CryptoEngine(key)
+        crypto = crypto_engine
 
         metadata = b"Important metadata"
         nonce = CryptoEngine.generate_nonce()
@@ -260,3 +463,21 @@ class TestCryptoEngine:
 
         with pytest.raises(EncryptionError):
             CryptoEngine(b"x" * 64)  # Too long
+
+    def test_custom_chunk_size(self):
+        """Test files stream with a custom chunk size and invalid sizes fail."""
+        key = os.urandom(CryptoEngine.KEY_SIZE)
+        crypto = CryptoEngine(key, chunk_size=CryptoEngine.MIN_CHUNK_SIZE)
+
+        test_data = os.urandom(CryptoEngine.ONE_SHOT_MAX_SIZE + 1000)
+        encrypted_file = BytesIO()
+        crypto.encrypt_file(BytesIO(test_data), encrypted_file)
+
+        # Chunk size only affects streaming, not the file format
+        encrypted_file.seek(0)
+        decrypted_file = BytesIO()
+        CryptoEngine(key).decrypt_file(encrypted_file, decrypted_file)
+        assert decrypted_file.getvalue() == test_data
+
+        with pytest.raises(EncryptionError):
+            CryptoEngine(key, chunk_size=CryptoEngine.MAX_CHUNK_SIZE + 1)
@@ -2,6 +2,7 @@
 
 import pytest
 import os
+from contextlib import nullcontext
 from pathlib import Path
 
 from app.services.encrypt_service import EncryptService
@@ -10,20 +11,22 @@ from app.core.exceptions import (
     InvalidPasswordError,
     DecryptionError,
     EncryptionError,
+    FileProcessingError,
 )
 
 
 class TestEncryptService:
     """Tests for EncryptService."""
 
-    def test_encrypt_folder_success(self, temp_dir, sample_files, sample_password):
+    def test_encrypt_folder_success(
+        self, temp_dir, sample_files, sample_password, encrypt_service
+    ):
         """Test successful folder encryption."""
         output_dir = temp_dir / "encrypted"
 
-        service = EncryptService(verify_password_strength=False)
-        service.encrypt_folder(
-            str(sample_files),
-            str(output_dir),
+        encrypt_service.encrypt_folder(
+            sample_files,
+            output_dir,
             sample_password,
         )
 
@@ -36,33 +39,83 @@ class TestEncryptService:
         assert (output_dir / "file1.txt.encrypted").exists()
         assert (output_dir / "folder1" / "file2.txt.encrypted").exists()
 
-    def test_encrypt_weak_password_rejected(self, temp_dir, sample_files, weak_password):
-        """Test that weak password is rejected when verification is enabled."""
+    def test_encrypt_folder_reports_info(
+        self, temp_dir, sample_files, sample_file_list, sample_password, encrypt_service
+    ):
+        """Test that folder totals are reported from the encryption scan."""
+        output_dir = temp_dir / "encrypted"
+        expected_size = sum(
+            (sample_files / rel_path).stat().st_size for rel_path in sample_file_list
+        )
+        reported = []
+
+        encrypt_service.encrypt_folder(
+            sample_files,
+            output_dir,
+            sample_password,
+            info_callback=lambda files, size: reported.append((files, size)),
+        )
+
+        assert reported == [(len(sample_file_list), expected_size)]
+
+    @pytest.mark.parametrize(
+        "verify_strength, expectation",
+        [
+            (True, pytest.raises(InvalidPasswordError)),
+            (False, nullcontext()),
+        ],
+        ids=["verified", "unverified"],
+    )
+    def test_encrypt_weak_password(
+        self, request, temp_dir, weak_password, verify_strength, expectation
+    ):
+        """Test that a weak password is rejected only when verification is on."""
         output_dir = temp_dir / "encrypted"
 
-        service = EncryptService(verify_password_strength=True)
+        # Rejection happens before the (empty) input folder is read, so the
+        # sample tree is only built when the password is accepted
+        input_dir = (
+            temp_dir if verify_strength else request.getfixturevalue("sample_files")
+        )
+
+        service = EncryptService(verify_password_strength=verify_strength)
 
-        with pytest.raises(InvalidPasswordError):
+        with expectation:
             service.encrypt_folder(
-                str(sample_files),
-                str(output_dir),
+                input_dir,
+                output_dir,
                 weak_password,
             )
 
-    def test_encrypt_weak_password_accepted_when_disabled(
-        self, temp_dir, sample_files, weak_password
+        if verify_strength:
+            assert not output_dir.exists()
+        else:
+            assert output_dir.exists()
+
+    def test_encrypt_decrypt_write_buffer_size(
+        self, temp_dir, sample_files, sample_password
     ):
-        """Test that weak password is accepted when verification is disabled."""
-        output_dir = temp_dir / "encrypted"
+        """Test a custom output buffer size round-trips and is validated."""
+        encrypted_dir = temp_dir / "encrypted"
+        decrypted_dir = temp_dir / "decrypted"
 
-        service = EncryptService(verify_password_strength=False)
-        service.encrypt_folder(
-            str(sample_files),
-            str(output_dir),
-            weak_password,
+        EncryptService(
+            verify_password_strength=False, write_buffer_size=1 << 20
+        ).encrypt_folder(sample_files, encrypted_dir, sample_password)
+        DecryptService(write_buffer_size=1 << 20).decrypt_folder(
+            encrypted_dir, decrypted_dir, sample_password
         )
 
-        assert output_dir.exists()
+        assert (decrypted_dir / "binary.bin").read_bytes() == (
+            sample_files / "binary.bin"
+        ).read_bytes()
+
+        with pytest.raises(FileProcessingError):
+            EncryptService(
+                verify_password_strength=False, write_buffer_size=0
+            ).encrypt_folder(
+                sample_files, temp_dir / "other", sample_password
+            )
 
     def test_encrypt_nonexistent_folder(self, temp_dir, sample_password):
         """Test encryption of nonexistent folder fails."""
@@ -73,8 +126,8 @@ class TestEncryptService:
 
         with pytest.raises(Exception):  # FileProcessingError or similar
             service.encrypt_folder(
-                str(input_dir),
-                str(output_dir),
+                input_dir,
+                output_dir,
                 sample_password,
             )
 
@@ -82,24 +135,17 @@ class TestEncryptService:
 class TestDecryptService:
     """Tests for DecryptService."""
 
-    def test_decrypt_folder_success(self, temp_dir, sample_files, sample_password):
+    def test_decrypt_folder_success(
+        self, temp_dir, sample_files, sample_password, encrypted_sample, decrypt_service
+    ):
         """Test successful folder decryption."""
-        encrypted_dir = temp_dir / "encrypted"
+        encrypted_dir = encrypted_sample
         decrypted_dir = temp_dir / "decrypted"
 
-        # First encrypt
-        encrypt_service = EncryptService(verify_password_strength=False)
-        encrypt_service.encrypt_folder(
-            str(sample_files),
-            str(encrypted_dir),
-            sample_password,
-        )
-
-        # Then decrypt
-        decrypt_service = DecryptService()
+        # Decrypt the shared encrypted sample folder
         decrypt_service.decrypt_folder(
-            str(encrypted_dir),
-            str(decrypted_dir),
+            encrypted_dir,
+            decrypted_dir,
             sample_password,
         )
 
@@ -114,62 +160,71 @@ class TestDecryptService:
         decrypted_content = (decrypted_dir / "file1.txt").read_text()
         assert original_content == decrypted_content
 
-    def test_decrypt_wrong_password(self, temp_dir, sample_files, sample_password):
+    def test_decrypt_wrong_password(self, temp_dir, encrypted_sample, decrypt_service):
         """Test decryption with wrong password fails."""
+        encrypted_dir = encrypted_sample
+        decrypted_dir = temp_dir / "decrypted"
+
+        # Try to decrypt with wrong password
+        with pytest.raises(DecryptionError):
+            decrypt_service.decrypt_folder(
+                encrypted_dir,
+                decrypted_dir,
+                "WrongPassword123!",
+            )
+
+    def test_decrypt_tampered_file(
+        self, temp_dir, sample_files, sample_password, encrypt_service, decrypt_service
+    ):
+        """Test tampered file fails authentication and leaves no output."""
         encrypted_dir = temp_dir / "encrypted"
         decrypted_dir = temp_dir / "decrypted"
 
-        # Encrypt
-        encrypt_service = EncryptService(verify_password_strength=False)
         encrypt_service.encrypt_folder(
-            str(sample_files),
-            str(encrypted_dir),
+            sample_files,
+            encrypted_dir,
             sample_password,
         )
 
-        # Try to decrypt with wrong password
-        decrypt_service = DecryptService()
+        # Flip a bit in the authentication tag
+        encrypted_file = encrypted_dir / "file1.txt.encrypted"
+        data = bytearray(encrypted_file.read_bytes())
+        data[-1] ^= 0x01
+        encrypted_file.write_bytes(bytes(data))
 
-        with pytest.raises(DecryptionError):
+        with pytest.raises(FileProcessingError):
             decrypt_service.decrypt_folder(
-                str(encrypted_dir),
-                str(decrypted_dir),
-                "WrongPassword123!",
+                encrypted_dir,
+                decrypted_dir,
+                sample_password,
             )
 
-    def test_decrypt_missing_salt(self, temp_dir, sample_password):
+        assert not (decrypted_dir / "file1.txt").exists()
+
+    def test_decrypt_missing_salt(self, temp_dir, sample_password, decrypt_service):
         """Test decryption without salt file fails."""
         encrypted_dir = temp_dir / "encrypted"
         encrypted_dir.mkdir()
         decrypted_dir = temp_dir / "decrypted"
 
-        decrypt_service = DecryptService()
-
         with pytest.raises(DecryptionError):
             decrypt_service.decrypt_folder(
-                str(encrypted_dir),
-                str(decrypted_dir),
+                encrypted_dir,
+                decrypted_dir,
                 sample_password,
             )
 
-    def test_encrypt_decrypt_binary_files(self, temp_dir, sample_files, sample_password):
+    def test_encrypt_decrypt_binary_files(
+        self, temp_dir, sample_files, sample_password, encrypted_sample, decrypt_service
+    ):
         """Test encryption and decryption of binary files."""
-        encrypted_dir = temp_dir / "encrypted"
+        encrypted_dir = encrypted_sample
         decrypted_dir = temp_dir / "decrypted"
 
-        # Encrypt
-        encrypt_service = EncryptService(verify_password_strength=False)
-        encrypt_service.encrypt_folder(
-            str(sample_files),
-            str(encrypted_dir),
-            sample_password,
-        )
-
         # Decrypt
-        decrypt_service = DecryptService()
         decrypt_service.decrypt_folder(
-            str(encrypted_dir),
-            str(decrypted_dir),
+            encrypted_dir,
+            decrypted_dir,
             sample_password,
         )
 
@@ -179,25 +234,16 @@ class TestDecryptService:
         assert original_binary == decrypted_binary
 
     def test_encrypt_decrypt_preserves_structure(
-        self, temp_dir, sample_files, sample_password
+        self, temp_dir, sample_password, encrypted_sample, decrypt_service
     ):
         """Test that folder structure is preserved."""
-        encrypted_dir = temp_dir / "encrypted"
+        encrypted_dir = encrypted_sample
         decrypted_dir = temp_dir / "decrypted"
 
-        # Encrypt
-        encrypt_service = EncryptService(verify_password_strength=False)
-        encrypt_service.encrypt_folder(
-            str(sample_files),
-            str(encrypted_dir),
-            sample_password,
-        )
-
         # Decrypt
-        decrypt_service = DecryptService()
         decrypt_service.decrypt_folder(
-            str(encrypted_dir),
-            str(decrypted_dir),
+            encrypted_dir,
+            decrypted_dir,
             sample_password,
         )
 